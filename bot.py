@@ -7,56 +7,234 @@ A Telegram bot for downloading high-quality music from streaming platforms
 import asyncio
 import logging
 import os
+import signal
 import sys
+from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
 
 # Add current directory to Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
-# Import only what's needed at module level
-from pyrogram import Client
+# Hoisted imports so handlers don't pay an import lookup per update
+from pyrogram import Client, filters
+from pyrogram.handlers import CallbackQueryHandler, MessageHandler
+
+from config_manager import Config
+from listeners.streamrip_listener import make_light_context
+from settings import handle_settings_callback, show_settings_menu
+from streamrip_utils.quality_selector import get_active_quality_selector
+from utils.bot_utils import get_user_id, is_authorized, telegram_handler
+from utils.message_utils import send_message
+
+# Use the libuv-backed event loop when available; it is a drop-in
+# replacement that roughly halves per-await overhead
+try:
+    if sys.platform == "win32":
+        import winloop as uvloop
+    else:
+        import uvloop
+
+    uvloop.install()
+except ImportError:
+    pass
+
+# Configure logging; the file/stream handlers write on a background
+# QueueListener thread so log calls never block the event loop
+import logging.handlers
+import queue
+
+_log_queue = queue.SimpleQueue()
+_log_formatter = logging.Formatter(
+    '[%(asctime)s] %(levelname)s - %(message)s [%(module)s:%(lineno)d]'
+)
+_file_handler = logging.FileHandler('streamrip_bot.log')
+_file_handler.setFormatter(_log_formatter)
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(_log_formatter)
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, _file_handler, _stream_handler, respect_handler_level=True
+)
+_log_listener.start()
 
-# Configure logging
 logging.basicConfig(
     level=logging.INFO,
-    format='[%(asctime)s] %(levelname)s - %(message)s [%(module)s:%(lineno)d]',
-    handlers=[
-        logging.FileHandler('streamrip_bot.log'),
-        logging.StreamHandler()
-    ]
+    handlers=[logging.handlers.QueueHandler(_log_queue)],
 )
 
 LOGGER = logging.getLogger(__name__)
 
 # Global variables
-task_dict = {}
-task_dict_lock = asyncio.Lock()
+# Task registry is sharded so unrelated users' status/cancel requests don't
+# contend on a single lock.
+#
+# Locking invariant: a shard lock is held only across the dict mutation or
+# snapshot itself, never across an await or any I/O. Readers snapshot the
+# shard under the lock and iterate/format outside it; writers pop under the
+# lock and run cancel callbacks outside it.
+_SHARDS = 16
+task_shards = [{} for _ in range(_SHARDS)]
+task_locks = [asyncio.Lock() for _ in range(_SHARDS)]
+
+# Secondary index user_id -> set of task_ids so /cancel only touches the
+# caller's tasks instead of scanning the whole registry
+user_tasks = {}
+
 bot = None
 user_bot = None
 
 
+# Bounded work queue so handlers ack the dispatcher immediately and the
+# heavy work runs on a small worker pool
+WORKERS = 8
+work_queue = asyncio.Queue(maxsize=1024)
+
+
+async def _worker(queue):
+    """Drain queued handler work"""
+    while True:
+        handler, message = await queue.get()
+        try:
+            await handler(message)
+        except Exception as e:
+            LOGGER.error(f"Error in queued handler: {e}")
+        finally:
+            queue.task_done()
+
+
+# Implicit batching of outbound replies: callers await a future while a
+# single drainer groups pending same-chat texts into one sendMessage call
+_send_queue = asyncio.Queue()
+_SEND_BATCH_MAX = 32
+_SEND_BATCH_WINDOW = 0.02  # seconds
+
+
+async def batched_send(chat_id, text):
+    """Send a message, coalescing with other pending sends to the same chat"""
+    fut = asyncio.get_running_loop().create_future()
+    await _send_queue.put((chat_id, text, fut))
+    return await fut
+
+
+async def _send_drainer():
+    """Drain queued sends in small batches grouped by chat"""
+    while True:
+        batch = [await _send_queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + _SEND_BATCH_WINDOW
+        while len(batch) < _SEND_BATCH_MAX:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(_send_queue.get(), timeout))
+            except TimeoutError:
+                break
+
+        groups = {}
+        for chat_id, text, fut in batch:
+            groups.setdefault(chat_id, []).append((text, fut))
+
+        for chat_id, entries in groups.items():
+            # Merge bodies while staying under Telegram's 4096-char limit
+            index = 0
+            while index < len(entries):
+                merged = [entries[index]]
+                size = len(entries[index][0])
+                index += 1
+                while (
+                    index < len(entries)
+                    and size + 2 + len(entries[index][0]) < 4096
+                ):
+                    size += 2 + len(entries[index][0])
+                    merged.append(entries[index])
+                    index += 1
+                try:
+                    sent = await bot.send_message(
+                        chat_id, "\n\n".join(text for text, _ in merged)
+                    )
+                except Exception as e:
+                    LOGGER.error(f"Error sending batched message: {e}")
+                    sent = None
+                for _text, fut in merged:
+                    if not fut.done():
+                        fut.set_result(sent)
+
+
+def _queued(handler):
+    """Wrap a message handler so it only enqueues work and returns"""
+
+    async def wrapper(client, message):
+        await work_queue.put((partial(handler, client), message))
+
+    return wrapper
+
+
+def _shard(task_id):
+    """Get shard index for a task ID"""
+    return hash(task_id) & (_SHARDS - 1)
+
+
+def _task_owner(task):
+    """Get the owning user_id of a task, if it has one"""
+    listener = getattr(task, 'listener', None)
+    return getattr(listener, 'user_id', None)
+
+
+async def add_task(task_id, task):
+    """Add a task to the sharded task registry"""
+    index = _shard(task_id)
+    async with task_locks[index]:
+        task_shards[index][task_id] = task
+    user_id = _task_owner(task)
+    if user_id is not None:
+        user_tasks.setdefault(user_id, set()).add(task_id)
+
+
+async def remove_task(task_id):
+    """Remove a task from the sharded task registry"""
+    index = _shard(task_id)
+    async with task_locks[index]:
+        task = task_shards[index].pop(task_id, None)
+    if task is not None:
+        user_id = _task_owner(task)
+        task_ids = user_tasks.get(user_id)
+        if task_ids is not None:
+            task_ids.discard(task_id)
+            if not task_ids:
+                user_tasks.pop(user_id, None)
+    return task
+
+
 async def main():
     """Main function to start the bot"""
     try:
         # Load configuration
         LOGGER.info("Loading configuration...")
-        from config_manager import Config
         Config.load()
 
         # Initialize Pyrogram clients
         LOGGER.info("Initializing Telegram clients...")
 
         global bot, user_bot
-        
+
+        # Scale the dispatcher pool with the machine instead of a fixed 4;
+        # Telegram's own rate limits are the effective ceiling
+        bot_workers = getattr(
+            Config, "BOT_WORKERS", max(4, (os.cpu_count() or 4) * 2)
+        )
+        max_transmissions = getattr(Config, "MAX_CONCURRENT_TRANSMISSIONS", 4)
+
         # Initialize bot client
         bot = Client(
             "streamrip_bot",
             api_id=Config.TELEGRAM_API,
             api_hash=Config.TELEGRAM_HASH,
             bot_token=Config.BOT_TOKEN,
-            workers=4,
+            workers=bot_workers,
+            max_concurrent_transmissions=max_transmissions,
         )
-        
+
         # Initialize user client if session string is provided
         if Config.USER_SESSION_STRING:
             user_bot = Client(
@@ -64,7 +242,8 @@ async def main():
                 api_id=Config.TELEGRAM_API,
                 api_hash=Config.TELEGRAM_HASH,
                 session_string=Config.USER_SESSION_STRING,
-                workers=2,
+                workers=max(2, bot_workers // 2),
+                max_concurrent_transmissions=max_transmissions,
             )
         
         # Register handlers
@@ -74,15 +253,23 @@ async def main():
         # Start clients
         LOGGER.info("Starting Telegram clients...")
         await bot.start()
+
+        # Spawn workers that drain the handler work queue
+        for _ in range(WORKERS):
+            asyncio.create_task(_worker(work_queue))
+
+        # Spawn the outbound send drainer
+        asyncio.create_task(_send_drainer())
         
         if user_bot:
             await user_bot.start()
             LOGGER.info("User client started successfully")
         
-        # Initialize streamrip configuration
+        # Initialize streamrip configuration eagerly so the first user
+        # request doesn't pay the cold-start cost
         LOGGER.info("Initializing streamrip configuration...")
         from streamrip_utils.streamrip_config import streamrip_config
-        if await streamrip_config.initialize():
+        if await streamrip_config.lazy_initialize():
             LOGGER.info("Streamrip configuration initialized successfully")
         else:
             LOGGER.warning("Failed to initialize streamrip configuration")
@@ -90,27 +277,45 @@ async def main():
         # Set bot commands
         await set_bot_commands()
         
+        # Fetch bot identity once; get_me is a network round-trip
+        username = (await bot.get_me()).username
+        started_at = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
+
         # Send startup message
         if Config.LOG_CHAT_ID:
             try:
                 await bot.send_message(
                     Config.LOG_CHAT_ID,
                     "🎵 <b>Streamrip Bot Started!</b>\n\n"
-                    f"🤖 <b>Bot:</b> @{(await bot.get_me()).username}\n"
+                    f"🤖 <b>Bot:</b> @{username}\n"
                     f"🎧 <b>Streamrip:</b> {'✅ Available' if Config.STREAMRIP_ENABLED else '❌ Disabled'}\n"
-                    f"⏰ <b>Started at:</b> {asyncio.get_event_loop().time()}"
+                    f"⏰ <b>Started at:</b> {started_at}"
                 )
             except Exception as e:
                 LOGGER.error(f"Failed to send startup message: {e}")
-        
+
         LOGGER.info("🎵 Streamrip Bot started successfully!")
-        LOGGER.info(f"Bot username: @{(await bot.get_me()).username}")
+        LOGGER.info(f"Bot username: @{username}")
         
-        # Keep the bot running
-        await asyncio.Event().wait()
-        
-    except KeyboardInterrupt:
-        LOGGER.info("Bot stopped by user")
+        # Park until a termination signal resolves the shutdown future, so
+        # SIGTERM (containers) runs the same cleanup path as Ctrl-C
+        loop = asyncio.get_running_loop()
+        stop = loop.create_future()
+
+        def _request_shutdown():
+            if not stop.done():
+                stop.set_result(None)
+
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            try:
+                loop.add_signal_handler(sig, _request_shutdown)
+            except NotImplementedError:
+                # Signal handlers aren't supported on this platform
+                pass
+
+        await stop
+        LOGGER.info("Shutdown signal received, stopping...")
+
     except Exception as e:
         LOGGER.error(f"Error starting bot: {e}")
         raise
@@ -120,101 +325,104 @@ async def main():
             await bot.stop()
         if user_bot:
             await user_bot.stop()
+        _log_listener.stop()
 
 
 def register_handlers():
     """Register command handlers"""
-    from pyrogram import filters
-    from pyrogram.handlers import MessageHandler, CallbackQueryHandler
+    # Command definitions bake in Config.CMD_SUFFIX, so they are imported
+    # here once after Config.load() rather than at module import time
+    from commands.bot_commands import BotCommands, HELP_TEXT, START_TEXT
     from commands.streamrip_commands import StreamripCommands
-    from commands.bot_commands import BotCommands
-    from utils.bot_utils import new_task
-    
-    # Import callback handlers
-    from streamrip_utils.quality_selector import get_active_quality_selector
-    from settings import handle_settings_callback
-    
+
     # Start command
     async def start_command(_, message):
-        from commands.bot_commands import START_TEXT
-        from utils.message_utils import send_message
         await send_message(message, START_TEXT)
-    
+
     # Help command
     async def help_command(_, message):
-        from commands.bot_commands import HELP_TEXT
-        from utils.message_utils import send_message
         await send_message(message, HELP_TEXT)
-    
+
     # Status command
     async def status_command(_, message):
-        from utils.message_utils import send_message
+        # Snapshot each shard under its own lock, then format outside the locks
+        tasks = []
+        for index in range(_SHARDS):
+            async with task_locks[index]:
+                tasks.extend(task_shards[index].items())
 
-        if not task_dict:
-            await send_message(message, "📭 <b>No active downloads</b>")
+        if not tasks:
+            await batched_send(message.chat.id, "📭 <b>No active downloads</b>")
             return
 
-        status_msg = "📊 <b>Active Downloads:</b>\n\n"
-        for task_id, task in task_dict.items():
+        parts = ["📊 <b>Active Downloads:</b>\n\n"]
+        for task_id, task in tasks:
             if hasattr(task, 'get_status_message'):
-                status_msg += task.get_status_message() + "\n\n"
+                parts.append(task.get_status_message())
             else:
-                status_msg += f"🎵 Task {task_id}: Active\n\n"
+                parts.append(f"🎵 Task {task_id}: Active")
+            parts.append("\n\n")
 
-        await send_message(message, status_msg)
+        await batched_send(message.chat.id, "".join(parts))
 
     # Settings command
     async def settings_command(_, message):
-        from utils.bot_utils import is_authorized, get_user_id
-        from utils.message_utils import send_message
-        from listeners.streamrip_listener import StreamripListener
-        from settings import show_settings_menu
-
         # Check authorization
         user_id = get_user_id(message)
         if not is_authorized(user_id):
             await send_message(message, "❌ You are not authorized to access settings!")
             return
 
-        # Create listener for settings
-        listener = StreamripListener(message, isLeech=False)
+        # Settings never downloads, so a light context is enough
+        listener = make_light_context(message)
 
         # Show settings menu
         await show_settings_menu(listener)
     
     # Cancel command
     async def cancel_command(_, message):
-        from utils.message_utils import send_message
-        from utils.bot_utils import get_user_id
-        
         user_id = get_user_id(message)
         cancelled_count = 0
-        
-        for task_id, task in list(task_dict.items()):
-            if hasattr(task, 'listener') and task.listener.user_id == user_id:
-                if hasattr(task, 'cancel_download'):
-                    task.cancel_download()
-                cancelled_count += 1
-                task_dict.pop(task_id, None)
-        
+
+        # Snapshot the caller's index entry so only their tasks are touched
+        for task_id in tuple(user_tasks.pop(user_id, ())):
+            task = await remove_task(task_id)
+            if task is None:
+                continue
+            if hasattr(task, 'cancel_download'):
+                task.cancel_download()
+            cancelled_count += 1
+
         if cancelled_count > 0:
-            await send_message(message, f"✅ Cancelled {cancelled_count} download(s)")
+            await batched_send(
+                message.chat.id, f"✅ Cancelled {cancelled_count} download(s)"
+            )
         else:
-            await send_message(message, "❌ No active downloads to cancel")
+            await batched_send(message.chat.id, "❌ No active downloads to cancel")
     
-    # Callback query handler for quality selector and settings
-    async def handle_callback_query(_, callback_query):
-        user_id = callback_query.from_user.id
-
-        # Check for active quality selector
-        quality_selector = get_active_quality_selector(user_id)
-        if quality_selector and callback_query.data.startswith("srq"):
-            await quality_selector._handle_callback(_, callback_query, quality_selector)
-            return
+    # Callback query handlers, dispatched by data prefix so unrelated
+    # callbacks never enter the wrong coroutine
+    async def _dispatch_quality(client, callback_query):
+        quality_selector = get_active_quality_selector(callback_query.from_user.id)
+        if quality_selector:
+            await quality_selector._handle_callback(
+                client, callback_query, quality_selector
+            )
+            return True
+        return False
 
-        # Check for settings callbacks
-        if await handle_settings_callback(_, callback_query):
-            return
+    cb_prefixes = (
+        ("srq", _dispatch_quality),
+        ("settings_", handle_settings_callback),
+    )
+
+    async def handle_callback_query(client, callback_query):
+        data = callback_query.data or ""
+        for prefix, dispatch in cb_prefixes:
+            if data.startswith(prefix):
+                if await dispatch(client, callback_query):
+                    return
+                break
 
         # Answer unknown callbacks
         try:
@@ -222,40 +430,39 @@ def register_handlers():
         except Exception:
             pass
     
-    # Register handlers
-    bot.add_handler(MessageHandler(start_command, filters.command(BotCommands.StartCommand)))
-    bot.add_handler(MessageHandler(help_command, filters.command(BotCommands.HelpCommand)))
-    bot.add_handler(MessageHandler(status_command, filters.command(BotCommands.StatusCommand)))
-    bot.add_handler(MessageHandler(settings_command, filters.command(BotCommands.SettingsCommand)))
-    bot.add_handler(MessageHandler(cancel_command, filters.command(BotCommands.CancelCommand)))
-    
-    # Streamrip commands
-    streamrip_mirror_commands = [
-        BotCommands.StreamripMirrorCommand,
-        BotCommands.SripCommand,
-        BotCommands.SrCommand
-    ]
-    
-    streamrip_leech_commands = [
-        BotCommands.StreamripLeechCommand,
-        BotCommands.SripLeechCommand,
-        BotCommands.SrLeechCommand
-    ]
-    
-    streamrip_search_commands = [
-        BotCommands.StreamripSearchCommand,
-        BotCommands.SripSearchCommand,
-        BotCommands.SrSearchCommand
-    ]
-    
-    for cmd in streamrip_mirror_commands:
-        bot.add_handler(MessageHandler(StreamripCommands.streamrip_mirror, filters.command(cmd)))
-    
-    for cmd in streamrip_leech_commands:
-        bot.add_handler(MessageHandler(StreamripCommands.streamrip_leech, filters.command(cmd)))
-    
-    for cmd in streamrip_search_commands:
-        bot.add_handler(MessageHandler(StreamripCommands.streamrip_search, filters.command(cmd)))
+    # Single command table: one MessageHandler whose filter matches every
+    # command, dispatching via a dict lookup instead of one filter chain
+    # per handler. Command work is still queued so the dispatcher isn't
+    # blocked while a handler runs.
+    queued_mirror = _queued(telegram_handler(StreamripCommands.streamrip_mirror))
+    queued_leech = _queued(telegram_handler(StreamripCommands.streamrip_leech))
+    queued_search = _queued(telegram_handler(StreamripCommands.streamrip_search))
+
+    cmd_table = {
+        BotCommands.StartCommand: _queued(telegram_handler(start_command)),
+        BotCommands.HelpCommand: _queued(telegram_handler(help_command)),
+        BotCommands.StatusCommand: _queued(telegram_handler(status_command)),
+        BotCommands.SettingsCommand: _queued(telegram_handler(settings_command)),
+        BotCommands.CancelCommand: _queued(telegram_handler(cancel_command)),
+        BotCommands.StreamripMirrorCommand: queued_mirror,
+        BotCommands.SripCommand: queued_mirror,
+        BotCommands.SrCommand: queued_mirror,
+        BotCommands.StreamripLeechCommand: queued_leech,
+        BotCommands.SripLeechCommand: queued_leech,
+        BotCommands.SrLeechCommand: queued_leech,
+        BotCommands.StreamripSearchCommand: queued_search,
+        BotCommands.SripSearchCommand: queued_search,
+        BotCommands.SrSearchCommand: queued_search,
+    }
+
+    async def _dispatch(client, message):
+        handler = cmd_table.get(message.command[0].lower())
+        if handler:
+            await handler(client, message)
+
+    # Build the one command Filter up front and reuse it for registration
+    commands_filter = filters.command(list(cmd_table))
+    bot.add_handler(MessageHandler(_dispatch, commands_filter))
     
     # Callback query handler
     bot.add_handler(CallbackQueryHandler(handle_callback_query))
@@ -40,16 +40,8 @@ class BotCommands:
     @classmethod
     def get_all_commands(cls):
         """Get all available commands"""
-        commands = {}
-        
-        for attr_name in dir(cls):
-            if attr_name.endswith('Command') and not attr_name.startswith('_'):
-                command_value = getattr(cls, attr_name)
-                if isinstance(command_value, str):
-                    commands[attr_name] = command_value
-        
-        return commands
-    
+        return cls._ALL
+
     @classmethod
     def get_streamrip_commands(cls):
         """Get streamrip-specific commands"""
@@ -68,26 +60,37 @@ class BotCommands:
     @classmethod
     def get_command_descriptions(cls):
         """Get command descriptions for help"""
-        return {
-            cls.StreamripMirrorCommand: "Mirror music from streaming platforms",
-            cls.StreamripLeechCommand: "Leech music from streaming platforms",
-            cls.StreamripSearchCommand: "Search music across platforms",
-            cls.SripCommand: "Mirror music (short command)",
-            cls.SripLeechCommand: "Leech music (short command)",
-            cls.SripSearchCommand: "Search music (short command)",
-            cls.SrCommand: "Mirror music (shortest command)",
-            cls.SrLeechCommand: "Leech music (shortest command)",
-            cls.SrSearchCommand: "Search music (shortest command)",
-            cls.StartCommand: "Start the bot",
-            cls.HelpCommand: "Show help message",
-            cls.StatusCommand: "Show download status",
-            cls.SettingsCommand: "Configure bot settings",
-            cls.CancelCommand: "Cancel current download",
-            cls.CancelAllCommand: "Cancel all downloads",
-            cls.RestartCommand: "[ADMIN] Restart the bot",
-            cls.LogCommand: "[ADMIN] View bot logs",
-            cls.ShellCommand: "[ADMIN] Execute shell commands",
-        }
+        return cls._DESCRIPTIONS
+
+
+# Both mappings are pure functions of Config.CMD_SUFFIX, which is fixed by
+# the time this module is imported, so materialize them once
+BotCommands._ALL = {
+    name: value
+    for name, value in vars(BotCommands).items()
+    if name.endswith("Command") and isinstance(value, str)
+}
+
+BotCommands._DESCRIPTIONS = {
+    BotCommands.StreamripMirrorCommand: "Mirror music from streaming platforms",
+    BotCommands.StreamripLeechCommand: "Leech music from streaming platforms",
+    BotCommands.StreamripSearchCommand: "Search music across platforms",
+    BotCommands.SripCommand: "Mirror music (short command)",
+    BotCommands.SripLeechCommand: "Leech music (short command)",
+    BotCommands.SripSearchCommand: "Search music (short command)",
+    BotCommands.SrCommand: "Mirror music (shortest command)",
+    BotCommands.SrLeechCommand: "Leech music (shortest command)",
+    BotCommands.SrSearchCommand: "Search music (shortest command)",
+    BotCommands.StartCommand: "Start the bot",
+    BotCommands.HelpCommand: "Show help message",
+    BotCommands.StatusCommand: "Show download status",
+    BotCommands.SettingsCommand: "Configure bot settings",
+    BotCommands.CancelCommand: "Cancel current download",
+    BotCommands.CancelAllCommand: "Cancel all downloads",
+    BotCommands.RestartCommand: "[ADMIN] Restart the bot",
+    BotCommands.LogCommand: "[ADMIN] View bot logs",
+    BotCommands.ShellCommand: "[ADMIN] Execute shell commands",
+}
 
 
 # Command help text
@@ -1,11 +1,13 @@
 import asyncio
 import os
+import re
+from dataclasses import dataclass, field
 from logging import getLogger
 
 from config_manager import Config
 from utils.bot_utils import arg_parser, is_authorized, get_user_id
 from utils.message_utils import send_message, auto_delete_message
-from listeners.streamrip_listener import StreamripListener
+from listeners.streamrip_listener import StreamripListener, make_light_context
 from download.streamrip_download import add_streamrip_download
 from streamrip_utils.url_parser import (
     is_file_input,
@@ -18,25 +20,60 @@ from streamrip_utils.search_handler import search_music
 
 LOGGER = getLogger(__name__)
 
+# Flags that consume the following token as their value
+_FLAGS_WITH_VALUE = frozenset(("-q", "-quality", "-c", "-codec", "-n"))
+
+# Cheap prefilter so only URL-shaped tokens hit the async URL checks;
+# platform:type:id tokens (the format /streamripsearch hands back) are
+# admitted alongside http(s) links
+_URLISH = re.compile(r"^(?:https?://|\w+:\w+:\S+$)", re.IGNORECASE).match
+
+
+@dataclass(slots=True)
+class _ParsedCmd:
+    """Command text parsed once and threaded through the handlers"""
+
+    tail: str
+    tokens: list = field(default_factory=list)
+    quality: int | None = None
+    codec: str | None = None
+    force: bool = False
+    name: str = ""
+    link: str = ""
+
 
 class StreamripCommands:
     """Streamrip download commands"""
 
     @staticmethod
-    def _get_streamrip_args():
-        """Get streamrip-specific argument definitions"""
-        return {
-            # Streamrip specific flags
-            "-q": "",  # Quality level
-            "-quality": "",  # Quality level (alias)
-            "-c": "",  # Codec
-            "-codec": "",  # Codec (alias)
-            "-f": False,  # Force run
-            "-fd": False,  # Force download
-            # Standard flags
-            "-n": "",  # Custom name
-            "link": "",
-        }
+    def _parse_cmd(message):
+        """Parse the command text once into a _ParsedCmd"""
+        text = message.text.split(maxsplit=1)
+        if len(text) < 2:
+            return None
+
+        tail = text[1]
+        args = arg_parser(tail, " ")
+
+        quality = None
+        raw_quality = args.get("-q") or args.get("-quality")
+        if raw_quality:
+            try:
+                quality = int(raw_quality)
+            except (TypeError, ValueError):
+                pass
+
+        codec = args.get("-c") or args.get("-codec") or None
+
+        return _ParsedCmd(
+            tail=tail,
+            tokens=tail.split(),
+            quality=quality,
+            codec=codec,
+            force=bool(args.get("-f") or args.get("-fd")),
+            name=args.get("-n") or "",
+            link=args.get("link", ""),
+        )
 
     @staticmethod
     async def _process_streamrip_download(message, is_leech=False):
@@ -55,9 +92,9 @@ class StreamripCommands:
                 await auto_delete_message(reply, time=300)
                 return
 
-            # Get command text
-            text = message.text.split(maxsplit=1)
-            if len(text) < 2:
+            # Parse command text once
+            parsed = StreamripCommands._parse_cmd(message)
+            if parsed is None:
                 reply = await send_message(
                     message,
                     "❌ Please provide a streamrip URL or search query!\n\n"
@@ -71,41 +108,43 @@ class StreamripCommands:
                 await auto_delete_message(reply, time=300)
                 return
 
-            # Parse arguments
-            args = arg_parser(text[1], " ")
-            
-            # Extract link from args
-            link = args.get("link", "")
+            # Extract link from parsed args
+            link = parsed.link
             if not link:
-                # Try to find URL in the text
-                words = text[1].split()
-                for word in words:
-                    if await is_streamrip_url(word) or is_lastfm_url(word):
-                        link = word
-                        break
-                
+                # Try to find a URL in the text; check the candidates in a
+                # single gather instead of awaiting each token serially
+                candidates = [word for word in parsed.tokens if _URLISH(word)]
+                if candidates:
+                    results = await asyncio.gather(
+                        *(is_streamrip_url(word) for word in candidates)
+                    )
+                    link = next(
+                        (
+                            word
+                            for word, matched in zip(candidates, results)
+                            if matched or is_lastfm_url(word)
+                        ),
+                        "",
+                    )
+
                 # If no URL found, treat as search query
                 if not link:
-                    search_query = text[1]
-                    # Remove flags from search query
-                    for flag in ["-q", "-quality", "-c", "-codec", "-f", "-fd", "-n"]:
-                        if flag in search_query:
-                            parts = search_query.split()
-                            filtered_parts = []
+                    # Strip flags from the search query in a single pass
+                    filtered_parts = []
+                    skip_next = False
+                    for part in parsed.tokens:
+                        if skip_next:
                             skip_next = False
-                            for i, part in enumerate(parts):
-                                if skip_next:
-                                    skip_next = False
-                                    continue
-                                if part == flag:
-                                    skip_next = True
-                                    continue
-                                if not part.startswith("-"):
-                                    filtered_parts.append(part)
-                            search_query = " ".join(filtered_parts)
-                    
+                            continue
+                        if part in _FLAGS_WITH_VALUE:
+                            skip_next = True
+                            continue
+                        if not part.startswith("-"):
+                            filtered_parts.append(part)
+                    search_query = " ".join(filtered_parts)
+
                     if search_query.strip():
-                        await StreamripCommands._handle_search(message, search_query.strip(), is_leech, args)
+                        await StreamripCommands._handle_search(message, search_query.strip(), is_leech, parsed)
                     else:
                         reply = await send_message(message, "❌ Please provide a URL or search query!")
                         await auto_delete_message(reply, time=300)
@@ -113,11 +152,11 @@ class StreamripCommands:
 
             # Handle file input
             if is_file_input(link):
-                await StreamripCommands._handle_file_input(message, link, is_leech, args)
+                await StreamripCommands._handle_file_input(message, link, is_leech, parsed)
                 return
 
             # Handle single URL
-            await StreamripCommands._handle_single_url(message, link, is_leech, args)
+            await StreamripCommands._handle_single_url(message, link, is_leech, parsed)
 
         except Exception as e:
             LOGGER.error(f"Error processing streamrip command: {e}")
@@ -125,37 +164,24 @@ class StreamripCommands:
             await auto_delete_message(reply, time=300)
 
     @staticmethod
-    async def _handle_search(message, query, is_leech, args):
+    async def _handle_search(message, query, is_leech, parsed):
         """Handle search functionality"""
         try:
             # Create listener
             listener = StreamripListener(message, isLeech=is_leech)
-            
+
             # Set custom name if provided
-            if args.get("-n"):
-                listener.name = args.get("-n")
+            if parsed.name:
+                listener.name = parsed.name
 
             # Perform search
             result = await search_music(listener, query)
-            
-            if result:
-                # Extract quality and codec from args
-                quality = None
-                codec = None
-                
-                if args.get("-q") or args.get("-quality"):
-                    try:
-                        quality = int(args.get("-q") or args.get("-quality"))
-                    except ValueError:
-                        pass
-                
-                if args.get("-c") or args.get("-codec"):
-                    codec = args.get("-c") or args.get("-codec")
 
+            if result:
                 # Start download with search result
                 url = result.get("url")
                 if url:
-                    await StreamripCommands._handle_single_url(message, url, is_leech, args)
+                    await StreamripCommands._handle_single_url(message, url, is_leech, parsed)
 
         except Exception as e:
             LOGGER.error(f"Error in search handler: {e}")
@@ -163,7 +189,7 @@ class StreamripCommands:
             await auto_delete_message(reply, time=300)
 
     @staticmethod
-    async def _handle_file_input(message, file_content, is_leech, args):
+    async def _handle_file_input(message, file_content, is_leech, parsed):
         """Handle file input with multiple URLs"""
         try:
             # Parse file content
@@ -174,18 +200,22 @@ class StreamripCommands:
                 await auto_delete_message(reply, time=300)
                 return
 
-            # Process each URL
-            for i, url in enumerate(urls):
-                try:
-                    await StreamripCommands._handle_single_url(message, url, is_leech, args)
-                    
-                    # Add delay between downloads to avoid overwhelming
-                    if i < len(urls) - 1:
-                        await asyncio.sleep(2)
-                        
-                except Exception as e:
-                    LOGGER.error(f"Error processing URL {url}: {e}")
-                    continue
+            # Process URLs concurrently with a bounded semaphore so large
+            # batches don't overwhelm the downloader
+            semaphore = asyncio.Semaphore(
+                getattr(Config, "STREAMRIP_FILE_CONCURRENCY", 3)
+            )
+
+            async def _process_one(url):
+                async with semaphore:
+                    try:
+                        await StreamripCommands._handle_single_url(
+                            message, url, is_leech, parsed
+                        )
+                    except Exception as e:
+                        LOGGER.error(f"Error processing URL {url}: {e}")
+
+            await asyncio.gather(*(_process_one(url) for url in urls))
 
         except Exception as e:
             LOGGER.error(f"Error handling file input: {e}")
@@ -193,41 +223,29 @@ class StreamripCommands:
             await auto_delete_message(reply, time=300)
 
     @staticmethod
-    async def _handle_single_url(message, url, is_leech, args):
+    async def _handle_single_url(message, url, is_leech, parsed):
         """Handle single URL download"""
         try:
             # Validate URL
-            parsed = await parse_streamrip_url(url)
-            if not parsed:
+            parsed_url = await parse_streamrip_url(url)
+            if not parsed_url:
                 reply = await send_message(message, f"❌ Invalid URL: {url}")
                 await auto_delete_message(reply, time=300)
                 return
 
-            platform, media_type, media_id = parsed
+            platform, media_type, media_id = parsed_url
 
             # Create listener
             listener = StreamripListener(message, isLeech=is_leech)
-            
-            # Set custom name if provided
-            if args.get("-n"):
-                listener.name = args.get("-n")
 
-            # Extract quality and codec from args
-            quality = None
-            codec = None
-            force = args.get("-f", False) or args.get("-fd", False)
-            
-            if args.get("-q") or args.get("-quality"):
-                try:
-                    quality = int(args.get("-q") or args.get("-quality"))
-                except ValueError:
-                    pass
-            
-            if args.get("-c") or args.get("-codec"):
-                codec = args.get("-c") or args.get("-codec")
+            # Set custom name if provided
+            if parsed.name:
+                listener.name = parsed.name
 
             # Start download
-            await add_streamrip_download(listener, url, quality, codec, force)
+            await add_streamrip_download(
+                listener, url, parsed.quality, parsed.codec, parsed.force
+            )
 
         except Exception as e:
             LOGGER.error(f"Error handling single URL: {e}")
@@ -263,10 +281,10 @@ class StreamripCommands:
                 return
 
             query = text[1]
-            
-            # Handle search without download
-            # Create temporary listener for search
-            listener = StreamripListener(message, isLeech=False)
+
+            # Search without download only needs a light context, not a
+            # full listener with a download directory
+            listener = make_light_context(message)
             
             # Perform search
             result = await search_music(listener, query)
@@ -1,12 +1,32 @@
 import os
+from importlib.util import find_spec
 from logging import getLogger
+from pathlib import Path
 
 LOGGER = getLogger(__name__)
 
 
-class Config:
+class _ConfigMeta(type):
+    """Bumps a version counter on every setting write so caches keyed on
+    Config state can tell exactly when they are stale"""
+
+    def __setattr__(cls, name, value):
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            super().__setattr__("_version", cls._version + 1)
+
+
+class Config(metaclass=_ConfigMeta):
     """Configuration manager for Streamrip Bot"""
 
+    # All state lives on the class itself (settings menus mutate these
+    # attributes at runtime); empty slots keep instances stateless if one
+    # is ever created by mistake
+    __slots__ = ()
+
+    # Incremented by _ConfigMeta on every public attribute write
+    _version = 0
+
     # Required settings
     BOT_TOKEN = ""
     OWNER_ID = 0
@@ -20,9 +40,13 @@ class Config:
     CMD_SUFFIX = ""
     AUTHORIZED_CHATS = ""
     SUDO_USERS = ""
+    # Parsed int-set forms of the above, rebuilt by _validate_config
+    AUTHORIZED_CHAT_IDS = frozenset()
+    SUDO_USER_IDS = frozenset()
 
     # Download settings
     DOWNLOAD_DIR = "/usr/src/app/downloads/"
+    DOWNLOAD_DIR_PATH = Path(DOWNLOAD_DIR)  # refreshed by _validate_config
     LEECH_SPLIT_SIZE = 0
     AS_DOCUMENT = False
     MEDIA_GROUP = False
@@ -31,6 +55,7 @@ class Config:
     STREAMRIP_ENABLED = True
     STREAMRIP_CONCURRENT_DOWNLOADS = 4
     STREAMRIP_MAX_SEARCH_RESULTS = 20
+    STREAMRIP_SEARCH_CONCURRENCY = 8
     STREAMRIP_ENABLE_DATABASE = True
     STREAMRIP_AUTO_CONVERT = True
 
@@ -38,7 +63,7 @@ class Config:
     STREAMRIP_DEFAULT_QUALITY = 3
     STREAMRIP_FALLBACK_QUALITY = 2
     STREAMRIP_DEFAULT_CODEC = "flac"
-    STREAMRIP_SUPPORTED_CODECS = ["flac", "mp3", "m4a", "ogg", "opus"]
+    STREAMRIP_SUPPORTED_CODECS = frozenset(("flac", "mp3", "m4a", "ogg", "opus"))
     STREAMRIP_QUALITY_FALLBACK_ENABLED = True
 
     # Platform settings
@@ -139,17 +164,27 @@ class Config:
     # Logging
     LOG_CHAT_ID = 0
 
+    # Set once load() has completed so repeat calls are no-ops
+    _loaded = False
+
     @classmethod
-    def load(cls):
+    def load(cls, force=False):
         """Load configuration from environment variables or config file"""
-        try:
-            # Try to import config file
+        if cls._loaded and not force:
+            return
+
+        # find_spec returns None for a missing config.py instead of paying
+        # for ImportError machinery on the env-only path
+        if find_spec("config") is not None:
             import config
 
-            for attr in dir(config):
-                if not attr.startswith("_"):
-                    setattr(cls, attr, getattr(config, attr))
-        except ImportError:
+            # vars() reads the module dict directly (no dir() sort, no
+            # per-name getattr); the isupper() gate keeps helper functions
+            # and imports inside config.py off the Config class
+            for name, value in vars(config).items():
+                if not name.startswith("_") and name.isupper():
+                    setattr(cls, name, value)
+        else:
             LOGGER.warning("config.py not found, using environment variables")
 
         # Override with environment variables
@@ -158,91 +193,65 @@ class Config:
         # Validate required settings
         cls._validate_config()
 
-    @classmethod
-    def _load_from_env(cls):
-        """Load configuration from environment variables"""
-        # Required settings
-        cls.BOT_TOKEN = os.environ.get("BOT_TOKEN", cls.BOT_TOKEN)
-        cls.OWNER_ID = int(os.environ.get("OWNER_ID", cls.OWNER_ID))
-        cls.TELEGRAM_API = int(os.environ.get("TELEGRAM_API", cls.TELEGRAM_API))
-        cls.TELEGRAM_HASH = os.environ.get("TELEGRAM_HASH", cls.TELEGRAM_HASH)
+        cls._loaded = True
 
+    # Environment variables recognized by _load_from_env and the type each
+    # one is coerced to; absent variables keep the class default
+    _ENV_SPEC = (
+        # Required settings
+        ("BOT_TOKEN", str),
+        ("OWNER_ID", int),
+        ("TELEGRAM_API", int),
+        ("TELEGRAM_HASH", str),
         # Optional settings
-        cls.DATABASE_URL = os.environ.get("DATABASE_URL", cls.DATABASE_URL)
-        cls.USER_SESSION_STRING = os.environ.get(
-            "USER_SESSION_STRING", cls.USER_SESSION_STRING
-        )
-        cls.CMD_SUFFIX = os.environ.get("CMD_SUFFIX", cls.CMD_SUFFIX)
-        cls.AUTHORIZED_CHATS = os.environ.get(
-            "AUTHORIZED_CHATS", cls.AUTHORIZED_CHATS
-        )
-        cls.SUDO_USERS = os.environ.get("SUDO_USERS", cls.SUDO_USERS)
-
+        ("DATABASE_URL", str),
+        ("USER_SESSION_STRING", str),
+        ("CMD_SUFFIX", str),
+        ("AUTHORIZED_CHATS", str),
+        ("SUDO_USERS", str),
         # Download settings
-        cls.DOWNLOAD_DIR = os.environ.get("DOWNLOAD_DIR", cls.DOWNLOAD_DIR)
-        cls.LEECH_SPLIT_SIZE = int(
-            os.environ.get("LEECH_SPLIT_SIZE", cls.LEECH_SPLIT_SIZE)
-        )
-        cls.AS_DOCUMENT = (
-            os.environ.get("AS_DOCUMENT", str(cls.AS_DOCUMENT)).lower() == "true"
-        )
-        cls.MEDIA_GROUP = (
-            os.environ.get("MEDIA_GROUP", str(cls.MEDIA_GROUP)).lower() == "true"
-        )
-
+        ("DOWNLOAD_DIR", str),
+        ("LEECH_SPLIT_SIZE", int),
+        ("AS_DOCUMENT", bool),
+        ("MEDIA_GROUP", bool),
         # Streamrip settings
-        cls.STREAMRIP_ENABLED = (
-            os.environ.get("STREAMRIP_ENABLED", str(cls.STREAMRIP_ENABLED)).lower()
-            == "true"
-        )
-        cls.STREAMRIP_CONCURRENT_DOWNLOADS = int(
-            os.environ.get(
-                "STREAMRIP_CONCURRENT_DOWNLOADS", cls.STREAMRIP_CONCURRENT_DOWNLOADS
-            )
-        )
-        cls.STREAMRIP_MAX_SEARCH_RESULTS = int(
-            os.environ.get(
-                "STREAMRIP_MAX_SEARCH_RESULTS", cls.STREAMRIP_MAX_SEARCH_RESULTS
-            )
-        )
-
+        ("STREAMRIP_ENABLED", bool),
+        ("STREAMRIP_CONCURRENT_DOWNLOADS", int),
+        ("STREAMRIP_MAX_SEARCH_RESULTS", int),
+        ("STREAMRIP_SEARCH_CONCURRENCY", int),
         # Authentication
-        cls.STREAMRIP_QOBUZ_EMAIL = os.environ.get(
-            "STREAMRIP_QOBUZ_EMAIL", cls.STREAMRIP_QOBUZ_EMAIL
-        )
-        cls.STREAMRIP_QOBUZ_PASSWORD = os.environ.get(
-            "STREAMRIP_QOBUZ_PASSWORD", cls.STREAMRIP_QOBUZ_PASSWORD
-        )
-        cls.STREAMRIP_TIDAL_ACCESS_TOKEN = os.environ.get(
-            "STREAMRIP_TIDAL_ACCESS_TOKEN", cls.STREAMRIP_TIDAL_ACCESS_TOKEN
-        )
-        cls.STREAMRIP_TIDAL_REFRESH_TOKEN = os.environ.get(
-            "STREAMRIP_TIDAL_REFRESH_TOKEN", cls.STREAMRIP_TIDAL_REFRESH_TOKEN
-        )
-        cls.STREAMRIP_DEEZER_ARL = os.environ.get(
-            "STREAMRIP_DEEZER_ARL", cls.STREAMRIP_DEEZER_ARL
-        )
-
+        ("STREAMRIP_QOBUZ_EMAIL", str),
+        ("STREAMRIP_QOBUZ_PASSWORD", str),
+        ("STREAMRIP_TIDAL_ACCESS_TOKEN", str),
+        ("STREAMRIP_TIDAL_REFRESH_TOKEN", str),
+        ("STREAMRIP_DEEZER_ARL", str),
         # Limits
-        cls.STREAMRIP_LIMIT = int(
-            os.environ.get("STREAMRIP_LIMIT", cls.STREAMRIP_LIMIT)
-        )
-        cls.DAILY_TASK_LIMIT = int(
-            os.environ.get("DAILY_TASK_LIMIT", cls.DAILY_TASK_LIMIT)
-        )
-        cls.USER_MAX_TASKS = int(
-            os.environ.get("USER_MAX_TASKS", cls.USER_MAX_TASKS)
-        )
-        cls.BOT_MAX_TASKS = int(os.environ.get("BOT_MAX_TASKS", cls.BOT_MAX_TASKS))
-
+        ("STREAMRIP_LIMIT", int),
+        ("DAILY_TASK_LIMIT", int),
+        ("USER_MAX_TASKS", int),
+        ("BOT_MAX_TASKS", int),
         # Status
-        cls.STATUS_UPDATE_INTERVAL = int(
-            os.environ.get("STATUS_UPDATE_INTERVAL", cls.STATUS_UPDATE_INTERVAL)
-        )
-        cls.STATUS_LIMIT = int(os.environ.get("STATUS_LIMIT", cls.STATUS_LIMIT))
-
+        ("STATUS_UPDATE_INTERVAL", int),
+        ("STATUS_LIMIT", int),
         # Logging
-        cls.LOG_CHAT_ID = int(os.environ.get("LOG_CHAT_ID", cls.LOG_CHAT_ID))
+        ("LOG_CHAT_ID", int),
+    )
+
+    _COERCE = {
+        str: str,
+        int: int,
+        bool: lambda raw: raw.lower() == "true",
+    }
+
+    @classmethod
+    def _load_from_env(cls):
+        """Load configuration from environment variables"""
+        env = os.environ
+        for name, env_type in cls._ENV_SPEC:
+            raw = env.get(name)
+            if raw is None:
+                continue
+            setattr(cls, name, cls._COERCE[env_type](raw))
 
     @classmethod
     def _validate_config(cls):
@@ -256,4 +265,30 @@ class Config:
         if not cls.TELEGRAM_HASH:
             raise ValueError("TELEGRAM_HASH is required")
 
+        # Precompute the Path form of settings that are immutable after
+        # load so hot paths don't re-parse the string every download
+        cls.DOWNLOAD_DIR_PATH = Path(cls.DOWNLOAD_DIR)
+
+        # Parse the space-separated ID lists once so the per-message auth
+        # check is a frozenset membership test, not a split + scan
+        cls.AUTHORIZED_CHAT_IDS = cls._parse_id_set(
+            "AUTHORIZED_CHATS", cls.AUTHORIZED_CHATS
+        )
+        cls.SUDO_USER_IDS = cls._parse_id_set("SUDO_USERS", cls.SUDO_USERS)
+
         LOGGER.info("Configuration loaded successfully")
+
+    @staticmethod
+    def _parse_id_set(name, raw):
+        """Parse a space-separated ID list into a frozenset of ints,
+        skipping malformed tokens with a warning instead of crashing
+        startup on one stray comma or comment"""
+        ids = set()
+        for token in str(raw).split():
+            try:
+                ids.add(int(token))
+            except ValueError:
+                LOGGER.warning(
+                    "Ignoring non-numeric token %r in %s", token, name
+                )
+        return frozenset(ids)
@@ -25,6 +25,7 @@ MEDIA_GROUP = False  # Group media files together when sending
 STREAMRIP_ENABLED = True  # Enable/disable streamrip feature
 STREAMRIP_CONCURRENT_DOWNLOADS = 4  # Concurrent downloads per platform
 STREAMRIP_MAX_SEARCH_RESULTS = 20  # Search results limit
+STREAMRIP_SEARCH_CONCURRENCY = 8  # Concurrent search requests across platforms
 STREAMRIP_ENABLE_DATABASE = True  # Enable download history tracking
 STREAMRIP_AUTO_CONVERT = True  # Enable automatic format conversion
 
@@ -32,7 +33,7 @@ STREAMRIP_AUTO_CONVERT = True  # Enable automatic format conversion
 STREAMRIP_DEFAULT_QUALITY = 3  # Default quality (0-4: 0=128kbps, 1=320kbps, 2=CD, 3=Hi-Res, 4=Hi-Res+)
 STREAMRIP_FALLBACK_QUALITY = 2  # Fallback if preferred quality unavailable
 STREAMRIP_DEFAULT_CODEC = "flac"  # Default output format
-STREAMRIP_SUPPORTED_CODECS = ["flac", "mp3", "m4a", "ogg", "opus"]  # Available formats
+STREAMRIP_SUPPORTED_CODECS = frozenset(("flac", "mp3", "m4a", "ogg", "opus"))  # Available formats
 STREAMRIP_QUALITY_FALLBACK_ENABLED = True  # Auto-fallback to lower quality
 
 # Streamrip Platform Settings
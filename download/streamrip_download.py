@@ -1,12 +1,25 @@
 import asyncio
+import copy
 import os
-import subprocess
 import time
-from pathlib import Path
 from logging import getLogger
 
+from config_manager import Config
+from streamrip_utils.streamrip_config import streamrip_config
+from streamrip_utils.url_parser import parse_streamrip_url
+from utils.message_utils import send_status_message
+
 LOGGER = getLogger(__name__)
 
+# Audio extensions recognized when scanning a finished download;
+# a tuple so str.endswith can test all of them in one C call
+_AUDIO_EXTS = (".flac", ".mp3", ".m4a", ".ogg", ".opus")
+
+
+async def _fail(listener, msg: str):
+    """Send a failure reply to the task's message"""
+    await send_status_message(listener.message, msg)
+
 try:
     from streamrip.client import (
         DeezerClient,
@@ -14,6 +27,7 @@ try:
         SoundcloudClient,
         TidalClient,
     )
+    from streamrip.rip.main import Main as StreamripMain
 
     STREAMRIP_AVAILABLE = True
 except ImportError:
@@ -37,17 +51,16 @@ class StreamripDownloadHelper:
         self.download_path = None
         self.current_track = None
         self._cancelled = False
-        self._start_time = time.time()
+        self._start_time = time.monotonic()
 
     async def download(self):
         """Start the download process"""
         try:
-            from config_manager import Config
-            from streamrip_utils.streamrip_config import streamrip_config
-            from streamrip_utils.url_parser import parse_streamrip_url
-
-            # Initialize streamrip config
-            if not await streamrip_config.lazy_initialize():
+            # Config is prewarmed at bot startup; this is a plain bool
+            # check on the warm path and only initializes as a fallback
+            if not streamrip_config.is_initialized() and not (
+                await streamrip_config.lazy_initialize()
+            ):
                 raise Exception("Failed to initialize streamrip configuration")
 
             # Parse URL to get platform and media info
@@ -59,64 +72,61 @@ class StreamripDownloadHelper:
 
             # Set download path
             self.download_path = (
-                Path(Config.DOWNLOAD_DIR) / f"streamrip_{self.listener.mid}"
+                Config.DOWNLOAD_DIR_PATH / f"streamrip_{self.listener.mid}"
             )
-            self.download_path.mkdir(parents=True, exist_ok=True)
-
-            # Prepare streamrip command
-            cmd = ["rip"]
-
-            # Add quality if specified
-            if self.quality is not None:
-                cmd.extend(["--quality", str(self.quality)])
-
-            # Add codec if specified
-            if self.codec:
-                cmd.extend(["--codec", self.codec])
-
-            # Add output directory
-            # cmd.extend(["--directory", str(self.download_path)])
-
-            # Add no-db flag if database is disabled
-            if not streamrip_config.is_database_enabled():
-                cmd.append("--no-db")
-
-            # Add subcommand 'url' and the actual URL
-            cmd.extend(["url", self.url])
-
-            LOGGER.info(f"Starting streamrip download: {' '.join(map(str, cmd))}")
-
-            # Run streamrip command
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=str(self.download_path),
+            await asyncio.to_thread(
+                self.download_path.mkdir, parents=True, exist_ok=True
             )
 
-            # Monitor the process
-            stdout, stderr = await process.communicate()
-
-            if process.returncode != 0:
-                error_msg = stderr.decode() if stderr else "Unknown error"
-                raise Exception(f"Streamrip download failed: {error_msg}")
-
-            # Check if files were downloaded
-            downloaded_files = list(self.download_path.rglob("*"))
-            audio_files = [
-                f
-                for f in downloaded_files
-                if f.suffix.lower() in [".flac", ".mp3", ".m4a", ".ogg", ".opus"]
-            ]
+            # Run streamrip in-process instead of shelling out to the rip
+            # CLI: no fork/exec, no second interpreter cold-start, and no
+            # stdout parsing. Deep-copy the shared config so per-task
+            # overrides (download folder, -q quality, -c conversion)
+            # never leak into concurrent tasks or persist after this one
+            config = copy.deepcopy(streamrip_config.get_config())
+
+            # Apply per-task overrides to the session config
+            if hasattr(config.session, "downloads"):
+                config.session.downloads.folder = os.fspath(self.download_path)
+            if self.quality is not None and hasattr(config.session, platform):
+                getattr(config.session, platform).quality = self.quality
+            if self.codec and hasattr(config.session, "conversion"):
+                config.session.conversion.enabled = True
+                config.session.conversion.codec = self.codec
+            if not streamrip_config.is_database_enabled() and hasattr(
+                config.session, "database"
+            ):
+                config.session.database.downloads_enabled = False
+
+            LOGGER.info("Starting streamrip download: %s", self.url)
+
+            try:
+                main = StreamripMain(config)
+                await main.add(self.url)
+                await main.resolve()
+                await main.rip()
+            except Exception as e:
+                raise Exception(f"Streamrip download failed: {e}")
+
+            # Check if files were downloaded; os.walk hands back plain
+            # name strings, so big albums full of artwork and booklets
+            # don't pay for a Path object per entry
+            audio_files = []
+            for root, _dirs, files in os.walk(self.download_path):
+                audio_files.extend(
+                    os.path.join(root, name)
+                    for name in files
+                    if name.lower().endswith(_AUDIO_EXTS)
+                )
 
             if not audio_files:
                 raise Exception("No audio files were downloaded")
 
-            LOGGER.info(f"Successfully downloaded {len(audio_files)} files")
+            LOGGER.info("Successfully downloaded %s files", len(audio_files))
             return True
 
         except Exception as e:
-            LOGGER.error(f"Download error: {e}")
+            LOGGER.error("Download error: %s", e)
             raise
 
     def cancel(self):
@@ -127,12 +137,15 @@ class StreamripDownloadHelper:
         """Check if download is cancelled"""
         return self._cancelled
 
-    def get_progress(self) -> dict:
-        """Get download progress"""
+    def get_progress(self, now: float | None = None) -> dict:
+        """Get download progress; callers polling several tasks in one
+        tick can pass a shared time.monotonic() reading"""
+        if now is None:
+            now = time.monotonic()
         return {
             "status": "downloading" if not self._cancelled else "cancelled",
             "current_track": self.current_track or "Unknown",
-            "elapsed_time": time.time() - self._start_time,
+            "elapsed_time": now - self._start_time,
         }
 
 
@@ -144,56 +157,27 @@ async def add_streamrip_download(
     force: bool = False,
 ):
     """Add streamrip download to queue"""
-    if not STREAMRIP_AVAILABLE:
-        from utils.message_utils import send_status_message
-
-        await send_status_message(listener.message, "❌ Streamrip is not available!")
-        return
-
     # Check if streamrip is enabled
-    from config_manager import Config
-
     if not Config.STREAMRIP_ENABLED:
-        from utils.message_utils import send_status_message
-
-        await send_status_message(
-            listener.message, "❌ Streamrip downloads are disabled!"
-        )
-        return
-
-    # Parse URL to validate
-    from streamrip_utils.url_parser import is_streamrip_url, parse_streamrip_url
+        return await _fail(listener, "❌ Streamrip downloads are disabled!")
 
-    if not await is_streamrip_url(url):
-        from utils.message_utils import send_status_message
-
-        await send_status_message(listener.message, "❌ Invalid streamrip URL!")
-        return
+    # Parse URL once to validate and get platform info; the parser is
+    # memoized so downstream re-parses of the same URL are dict hits
+    parsed = await parse_streamrip_url(url)
+    if not parsed:
+        return await _fail(listener, "❌ Invalid streamrip URL!")
 
     try:
-        # Parse URL to get platform info
-        parsed = await parse_streamrip_url(url)
-        if not parsed:
-            from utils.message_utils import send_status_message
-
-            await send_status_message(listener.message, "❌ Failed to parse URL!")
-            return
-
         platform, media_type, media_id = parsed
 
         # Check if platform is enabled and configured
-        from streamrip_utils.streamrip_config import streamrip_config
-
         platform_status = streamrip_config.get_platform_status()
 
         if not platform_status.get(platform, False):
-            from utils.message_utils import send_status_message
-
-            await send_status_message(
-                listener.message,
+            return await _fail(
+                listener,
                 f"❌ {platform.title()} is not configured! Please add credentials in bot settings.",
             )
-            return
 
         # Show quality selector if not specified
         if quality is None or codec is None:
@@ -219,8 +203,6 @@ async def add_streamrip_download(
         # task_dict[listener.mid] = status
 
         # Start download
-        from utils.message_utils import send_status_message
-
         await send_status_message(
             listener.message,
             f"🎵 <b>Starting {platform.title()} download...</b>\n"
@@ -236,12 +218,16 @@ async def add_streamrip_download(
         await listener.on_download_complete()
 
     except Exception as e:
-        LOGGER.error(f"Error adding streamrip download: {e}")
-        from utils.message_utils import send_status_message
+        LOGGER.error("Error adding streamrip download: %s", e)
+        await _fail(listener, f"❌ <b>Download failed:</b> {str(e)}")
 
-        await send_status_message(
-            listener.message, f"❌ <b>Download failed:</b> {str(e)}"
-        )
+
+if not STREAMRIP_AVAILABLE:
+    # Rebind the entry point once at import instead of re-checking
+    # STREAMRIP_AVAILABLE on every call
+    async def add_streamrip_download(listener, *_args, **_kwargs):
+        """Stub used when the streamrip package is not installed"""
+        await _fail(listener, "❌ Streamrip is not available!")
 
 
 async def extract_streamrip_metadata_name(
@@ -251,8 +237,6 @@ async def extract_streamrip_metadata_name(
     try:
         # This would use streamrip API to get metadata
         # For now, return a simple name
-        from streamrip_utils.url_parser import parse_streamrip_url
-
         parsed = await parse_streamrip_url(url)
         if not parsed:
             return None
@@ -261,5 +245,5 @@ async def extract_streamrip_metadata_name(
         return f"{platform}_{media_type}_{media_id}"
 
     except Exception as e:
-        LOGGER.error(f"Error extracting metadata name: {e}")
+        LOGGER.error("Error extracting metadata name: %s", e)
         return None
@@ -1,18 +1,87 @@
+import asyncio
+import os
+import shutil
+import sys
 import time
+from dataclasses import dataclass
+from itertools import count
 from logging import getLogger
-from pathlib import Path
+from typing import Any
+
+from pyrogram.types import InputMediaAudio
+
+from config_manager import Config
+from utils.bot_utils import get_user_tag
+from utils.message_utils import send_message
 
 LOGGER = getLogger(__name__)
 
+# Task IDs come from a process-wide counter: unlike the old
+# millisecond-timestamp scheme, two tasks started in the same
+# millisecond can no longer share a download directory
+_TASK_COUNTER = count(int(time.time() * 1000))
+
+# Audio extensions recognized when collecting files to upload
+_AUDIO_EXTS = (".flac", ".mp3", ".m4a", ".ogg", ".opus")
+
+
+def _scan_audio(root):
+    """Yield audio file paths under root as plain strings; os.scandir
+    skips the per-entry Path construction and stat that rglob pays"""
+    stack = [os.fspath(root)]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.lower().endswith(_AUDIO_EXTS):
+                    yield entry.path
+
+
+@dataclass(slots=True)
+class LightListenerContext:
+    """Lightweight stand-in for StreamripListener on paths that never
+    download (settings menus, bare searches); carries no directory state"""
+
+    message: Any
+    user_id: int
+    tag: str
+    is_leech: bool = False
+    name: str = ""
+    is_cancelled: bool = False
+
+
+def make_light_context(message, is_leech=False):
+    """Build a LightListenerContext from a message"""
+    return LightListenerContext(
+        message=message,
+        user_id=message.from_user.id,
+        tag=get_user_tag(message),
+        is_leech=is_leech,
+    )
+
 
 class StreamripListener:
     """Streamrip download listener"""
 
+    __slots__ = (
+        "message",
+        "is_leech",
+        "user_id",
+        "tag",
+        "mid",
+        "name",
+        "dir",
+        "up_dest",
+        "rc_flags",
+        "is_cancelled",
+        "_start_time",
+    )
+
     def __init__(self, message, isLeech=False, tag=None, user_id=None):
         # Set required attributes
         self.message = message
         self.is_leech = isLeech
-        self.isLeech = isLeech  # Alias for compatibility
 
         # User information
         self.user_id = user_id or message.from_user.id
@@ -29,11 +98,14 @@ class StreamripListener:
 
         # Status
         self.is_cancelled = False
-        self._start_time = time.time()
+        self._start_time = time.monotonic()
 
         # Initialize download directory
         self._setup_download_dir()
 
+    # Read-only alias kept for callers using the old camelCase name
+    isLeech = property(lambda self: self.is_leech)
+
     def _get_user_tag(self):
         """Get user tag for mentions"""
         user = self.message.from_user
@@ -44,19 +116,17 @@ class StreamripListener:
 
     def _generate_task_id(self):
         """Generate a unique task ID"""
-        return str(int(time.time() * 1000))
+        return str(next(_TASK_COUNTER))
 
     def _setup_download_dir(self):
-        """Setup download directory"""
-        from config_manager import Config
-
-        base_dir = Path(Config.DOWNLOAD_DIR)
-        self.dir = base_dir / f"streamrip_{self.mid}"
-        self.dir.mkdir(parents=True, exist_ok=True)
+        """Assign the task directory; it is created on download start so
+        __init__ never blocks the event loop on a slow volume"""
+        self.dir = Config.DOWNLOAD_DIR_PATH / f"streamrip_{self.mid}"
 
     async def on_download_start(self):
         """Called when download starts"""
         LOGGER.info(f"Starting streamrip download for user {self.user_id}")
+        await asyncio.to_thread(self.dir.mkdir, parents=True, exist_ok=True)
 
     async def on_download_progress(self, current_track=None):
         """Called during download progress"""
@@ -85,8 +155,6 @@ class StreamripListener:
     async def on_download_error(self, error_message):
         """Called when download fails"""
         try:
-            from utils.message_utils import send_message
-
             await send_message(
                 self.message,
                 f"{self.tag} ❌ <b>Download failed:</b>\n<code>{error_message}</code>",
@@ -101,44 +169,84 @@ class StreamripListener:
     async def _handle_leech_upload(self):
         """Handle leech upload (send files to Telegram)"""
         try:
-            from utils.message_utils import send_message
-
-            # Get all audio files
-            audio_files = list(self.dir.rglob("*"))
-            audio_files = [
-                f
-                for f in audio_files
-                if f.suffix.lower() in [".flac", ".mp3", ".m4a", ".ogg", ".opus"]
-            ]
-
-            if not audio_files:
+            # Probe for the first audio file before materializing the
+            # rest, so an empty rip fails without walking the whole tree
+            audio_iter = _scan_audio(self.dir)
+            first = next(audio_iter, None)
+            if first is None:
                 raise Exception("No audio files found")
 
+            audio_files = [first, *audio_iter]
+
             # Send files to Telegram
             await send_message(
                 self.message,
                 f"{self.tag} 📤 <b>Uploading {len(audio_files)} files...</b>",
             )
 
-            for audio_file in audio_files:
-                try:
-                    # Send audio file
-                    with open(audio_file, "rb") as f:
+            # Uploads are Telegram-RTT bound: send tracks as media groups
+            # of up to 10 per request, and run the groups concurrently
+            # behind a semaphore instead of paying each RTT in sequence
+            sem = asyncio.Semaphore(Config.STREAMRIP_CONCURRENT_DOWNLOADS)
+
+            async def _upload_group(chunk):
+                # Passing paths lets pyrogram stream the files in its own
+                # thread pool; a blocking open() here would stall the
+                # event loop for the duration of each lossless read
+                async with sem:
+                    # Telegram requires 2-10 items per media group, so a
+                    # single track (or a remainder chunk of one) goes out
+                    # as a plain audio message
+                    if len(chunk) == 1:
+                        name = os.path.basename(chunk[0])
                         await self.message.reply_audio(
-                            f,
-                            caption=f"🎵 {audio_file.name}",
-                            title=audio_file.stem,
+                            chunk[0],
+                            caption=f"🎵 {name}",
+                            title=os.path.splitext(name)[0],
+                        )
+                        return
+                    media = []
+                    for audio_file in chunk:
+                        name = os.path.basename(audio_file)
+                        media.append(
+                            InputMediaAudio(
+                                audio_file,
+                                caption=f"🎵 {name}",
+                                title=os.path.splitext(name)[0],
+                            )
                         )
-                except Exception as e:
-                    LOGGER.error(f"Error uploading file {audio_file}: {e}")
+                    await self.message.reply_media_group(media)
 
-            # Send completion message
-            await send_message(
-                self.message,
-                f"{self.tag} ✅ <b>Upload completed!</b>\n"
-                f"📁 <b>Files:</b> {len(audio_files)}\n"
-                f"⏱️ <b>Total time:</b> {self._get_elapsed_time()}",
+            groups = [
+                audio_files[i : i + 10]
+                for i in range(0, len(audio_files), 10)
+            ]
+            results = await asyncio.gather(
+                *(_upload_group(g) for g in groups), return_exceptions=True
             )
+            failed = 0
+            for group, result in zip(groups, results):
+                if isinstance(result, Exception):
+                    failed += len(group)
+                    LOGGER.error(f"Error uploading files {group}: {result}")
+
+            # Send completion message; don't claim success for files
+            # whose upload chunk failed
+            uploaded = len(audio_files) - failed
+            if failed:
+                await send_message(
+                    self.message,
+                    f"{self.tag} ⚠️ <b>Upload finished with errors!</b>\n"
+                    f"📁 <b>Uploaded:</b> {uploaded}/{len(audio_files)} files\n"
+                    f"⏱️ <b>Total time:</b> {self._get_elapsed_time()}",
+                )
+            else:
+                await send_message(
+                    self.message,
+                    f"{self.tag} ✅ <b>Upload completed!</b>\n"
+                    f"📁 <b>Files:</b> {len(audio_files)}\n"
+                    f"⏱️ <b>Total time:</b> {self._get_elapsed_time()}",
+                )
 
             # Cleanup
             await self._cleanup()
@@ -150,8 +258,6 @@ class StreamripListener:
     async def _handle_mirror_upload(self):
         """Handle mirror upload (upload to cloud storage)"""
         try:
-            from utils.message_utils import send_message
-
             # For now, just send a message that mirror is not implemented
             await send_message(
                 self.message,
@@ -170,29 +276,37 @@ class StreamripListener:
     async def _cleanup(self):
         """Cleanup download directory"""
         try:
-            import shutil
+            if not self.dir.exists():
+                return
+
+            if sys.platform == "linux":
+                # One rm -rf on the top directory beats shutil.rmtree's
+                # per-entry Python recursion on big rips, and the
+                # subprocess keeps the event loop free while it runs
+                proc = await asyncio.create_subprocess_exec(
+                    "rm", "-rf", str(self.dir)
+                )
+                await proc.wait()
+            else:
+                await asyncio.to_thread(
+                    shutil.rmtree, self.dir, ignore_errors=True
+                )
 
-            if self.dir.exists():
-                shutil.rmtree(self.dir)
-                LOGGER.info(f"Cleaned up download directory: {self.dir}")
+            LOGGER.info(f"Cleaned up download directory: {self.dir}")
 
         except Exception as e:
             LOGGER.error(f"Error cleaning up directory {self.dir}: {e}")
 
     def _get_elapsed_time(self):
         """Get elapsed time in readable format"""
-        elapsed = time.time() - self._start_time
+        hours, rem = divmod(int(time.monotonic() - self._start_time), 3600)
+        minutes, seconds = divmod(rem, 60)
 
-        if elapsed < 60:
-            return f"{int(elapsed)}s"
-        elif elapsed < 3600:
-            minutes = int(elapsed // 60)
-            seconds = int(elapsed % 60)
-            return f"{minutes}m {seconds}s"
-        else:
-            hours = int(elapsed // 3600)
-            minutes = int((elapsed % 3600) // 60)
+        if hours:
             return f"{hours}h {minutes}m"
+        if minutes:
+            return f"{minutes}m {seconds}s"
+        return f"{seconds}s"
 
     def cancel(self):
         """Cancel the download"""
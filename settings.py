@@ -4,13 +4,37 @@ Provides interactive interface for managing bot settings
 """
 
 import asyncio
-from time import time
+from time import monotonic
 from logging import getLogger
+from weakref import WeakValueDictionary
+
+from config_manager import Config
+from streamrip_utils.streamrip_config import streamrip_config
+from utils.button_build import ButtonMaker
+from utils.message_utils import delete_message, edit_message, send_message
 
 LOGGER = getLogger(__name__)
 
-# Global registry for active settings sessions
-_active_settings_sessions = {}
+# Global registry for active settings sessions; weak values mean a
+# session abandoned without unregistering is collected with its owner
+_active_settings_sessions = WeakValueDictionary()
+
+_REAPER_INTERVAL = 60  # seconds
+_reaper_task = None
+
+# Window over which rapid toggle presses coalesce into one menu edit;
+# Telegram rate-limits editMessageText to roughly one per second
+_DEBOUNCE_WINDOW = 0.15  # seconds
+
+
+async def _reaper():
+    """Periodically evict sessions that outlived their timeout"""
+    while True:
+        await asyncio.sleep(_REAPER_INTERVAL)
+        now = monotonic()
+        for user_id, session in list(_active_settings_sessions.items()):
+            if session._time + session._timeout < now:
+                _active_settings_sessions.pop(user_id, None)
 
 
 def get_active_settings_session(user_id):
@@ -20,7 +44,11 @@ def get_active_settings_session(user_id):
 
 def register_settings_session(user_id, session):
     """Register a settings session for a user"""
+    global _reaper_task
+
     _active_settings_sessions[user_id] = session
+    if _reaper_task is None:
+        _reaper_task = asyncio.create_task(_reaper())
 
 
 def unregister_settings_session(user_id):
@@ -28,18 +56,197 @@ def unregister_settings_session(user_id):
     _active_settings_sessions.pop(user_id, None)
 
 
+# Menu message templates, built once at import so each render is a
+# single format call instead of a chain of += concatenations
+_MAIN_TPL = (
+    "<b>⚙️ Streamrip Bot Settings</b>\n\n"
+    "<b>🤖 Bot Status:</b> {status}\n"
+    "<b>👤 Owner:</b> <code>{owner}</code>\n"
+    "<b>📁 Download Dir:</b> <code>{download_dir}</code>\n\n"
+    "<b>🎵 Platform Status:</b>\n"
+    "🟦 Qobuz: {qobuz}\n"
+    "⚫ Tidal: {tidal}\n"
+    "🟣 Deezer: {deezer}\n"
+    "🟠 SoundCloud: {soundcloud}\n\n"
+    "<b>⏱️ Session timeout:</b> <code>{timeout}</code>"
+)
+
+_PLATFORMS_MSG = (
+    "<b>🎵 Platform Configuration</b>\n\n"
+    "Configure streaming platform credentials:\n\n"
+)
+
+# Quality level labels indexed by quality number
+_QUALITY_NAMES = ("128kbps", "320kbps", "CD", "Hi-Res", "Hi-Res+")
+
+_QUALITY_TPL = (
+    "<b>📊 Quality Settings</b>\n\n"
+    "<b>Default Quality:</b> <code>{quality}</code>\n"
+    "<b>Default Codec:</b> <code>{codec}</code>\n"
+    "<b>Fallback Quality:</b> <code>{fallback}</code>\n\n"
+    "<b>Available Codecs:</b>\n"
+)
+
+_DOWNLOAD_TPL = (
+    "<b>📥 Download Settings</b>\n\n"
+    "<b>Download Directory:</b>\n<code>{download_dir}</code>\n\n"
+    "<b>Concurrent Downloads:</b> <code>{concurrent}</code>\n"
+    "<b>Max Search Results:</b> <code>{max_results}</code>\n"
+    "<b>Database Enabled:</b> {database}\n"
+    "<b>Auto Convert:</b> {convert}\n\n"
+)
+
+_PLATFORM_TPL = (
+    "<b>{name} Configuration</b>\n\n"
+    "{cred_lines}"
+    "<b>Enabled:</b> {enabled}\n"
+    "<b>Quality:</b> <code>{quality}</code>\n\n"
+)
+
+# Credential lines per platform, formatted from the platform info dict
+_CRED_TPLS = {
+    "qobuz": (
+        "<b>Email:</b> <code>{email}</code>\n"
+        "<b>Password:</b> <code>{password}</code>\n"
+    ),
+    "tidal": "<b>Access Token:</b> <code>{token}</code>\n",
+    "deezer": "<b>ARL Cookie:</b> <code>{arl}</code>\n",
+}
+
+# Static button layouts shared by every render; only state markers in
+# dynamic labels vary per call
+_MAIN_BUTTONS = (
+    ("🎵 Platform Settings", "settings_platforms", "main"),
+    ("📊 Quality Settings", "settings_quality", "main"),
+    ("📥 Download Settings", "settings_download", "main"),
+    ("💾 Save Changes", "settings_save", "footer"),
+    ("❌ Close", "settings_close", "footer"),
+)
+
+_PLATFORMS_BUTTONS = (
+    ("🟦 Qobuz Settings", "settings_platform_qobuz", "main"),
+    ("⚫ Tidal Settings", "settings_platform_tidal", "main"),
+    ("🟣 Deezer Settings", "settings_platform_deezer", "main"),
+    ("🟠 SoundCloud Settings", "settings_platform_soundcloud", "main"),
+    ("⬅️ Back", "settings_main", "footer"),
+    ("❌ Close", "settings_close", "footer"),
+)
+
+_NAV_BUTTONS = (
+    ("⬅️ Back", "settings_main", "footer"),
+    ("❌ Close", "settings_close", "footer"),
+)
+
+_PLATFORM_NAV_BUTTONS = (
+    ("⬅️ Back to Platforms", "settings_platforms", "footer"),
+    ("❌ Close", "settings_close", "footer"),
+)
+
+
+def _add_buttons(buttons, spec):
+    """Append a static button layout to a ButtonMaker"""
+    for label, data, position in spec:
+        buttons.data_button(label, data, position)
+
+
+# Toggle key -> Config attribute flipped by _handle_toggle
+_TOGGLES = {
+    "database": "STREAMRIP_ENABLE_DATABASE",
+    "convert": "STREAMRIP_AUTO_CONVERT",
+    "qobuz": "STREAMRIP_QOBUZ_ENABLED",
+    "tidal": "STREAMRIP_TIDAL_ENABLED",
+    "deezer": "STREAMRIP_DEEZER_ENABLED",
+    "soundcloud": "STREAMRIP_SOUNDCLOUD_ENABLED",
+}
+
+# Platform -> Config attribute holding its quality level
+_QUALITY_ATTRS = {
+    "qobuz": "STREAMRIP_QOBUZ_QUALITY",
+    "tidal": "STREAMRIP_TIDAL_QUALITY",
+    "deezer": "STREAMRIP_DEEZER_QUALITY",
+    "soundcloud": "STREAMRIP_SOUNDCLOUD_QUALITY",
+}
+
+# Per-platform info builders so a platform page only reads its own
+# Config fields when rendered
+_PLATFORM_INFO_BUILDERS = {
+    "qobuz": lambda: {
+        "name": "🟦 Qobuz",
+        "email": Config.STREAMRIP_QOBUZ_EMAIL,
+        "password": "***" if Config.STREAMRIP_QOBUZ_PASSWORD else "",
+        "enabled": Config.STREAMRIP_QOBUZ_ENABLED,
+        "quality": Config.STREAMRIP_QOBUZ_QUALITY,
+    },
+    "tidal": lambda: {
+        "name": "⚫ Tidal",
+        "token": "***" if Config.STREAMRIP_TIDAL_ACCESS_TOKEN else "",
+        "enabled": Config.STREAMRIP_TIDAL_ENABLED,
+        "quality": Config.STREAMRIP_TIDAL_QUALITY,
+    },
+    "deezer": lambda: {
+        "name": "🟣 Deezer",
+        "arl": "***" if Config.STREAMRIP_DEEZER_ARL else "",
+        "enabled": Config.STREAMRIP_DEEZER_ENABLED,
+        "quality": Config.STREAMRIP_DEEZER_QUALITY,
+    },
+    "soundcloud": lambda: {
+        "name": "🟠 SoundCloud",
+        "enabled": Config.STREAMRIP_SOUNDCLOUD_ENABLED,
+        "quality": Config.STREAMRIP_SOUNDCLOUD_QUALITY,
+    },
+}
+
+
 class StreamripSettings:
     """Interactive settings manager for streamrip bot configuration"""
 
+    # __weakref__ keeps the slotted instances usable in the weak registry
+    __slots__ = (
+        "listener",
+        "_reply_to",
+        "_time",
+        "_timeout",
+        "event",
+        "current_menu",
+        "current_platform",
+        "_changes_made",
+        "_actions",
+        "_pending_render",
+        "_latest_menu",
+        "__weakref__",
+    )
+
     def __init__(self, listener):
         self.listener = listener
         self._reply_to = None
-        self._time = time()
+        self._time = monotonic()
         self._timeout = 300  # 5 minutes
         self.event = asyncio.Event()
         self.current_menu = "main"
         self.current_platform = None
         self._changes_made = False
+        self._pending_render = None
+        self._latest_menu = None
+
+        # Callback action dispatch; each entry takes the split callback
+        # data and returns a coroutine, or None when the data is short
+        self._actions = {
+            "main": lambda d: self._show_main_menu(),
+            "platforms": lambda d: self._show_platforms_menu(),
+            "quality": lambda d: self._show_quality_menu(),
+            "download": lambda d: self._show_download_menu(),
+            "platform": lambda d: self._select_platform(d[2])
+            if len(d) >= 3
+            else None,
+            "set": lambda d: self._handle_setting_change(
+                "_".join(d[2:-1]), d[-1]
+            )
+            if len(d) >= 4
+            else None,
+            "toggle": lambda d: self._handle_toggle(d[2]) if len(d) >= 3 else None,
+            "save": lambda d: self._save_settings(),
+            "close": lambda d: self._close_settings(),
+        }
 
     async def show_settings_menu(self):
         """Show main settings interface"""
@@ -65,8 +272,6 @@ class StreamripSettings:
             await asyncio.wait_for(self.event.wait(), timeout=self._timeout)
         except TimeoutError:
             LOGGER.warning("Settings session timed out")
-            from utils.message_utils import send_message, delete_message
-            
             timeout_msg = await send_message(
                 self.listener.message,
                 f"{self.listener.tag} ⏰ <b>Settings session timed out.</b>"
@@ -94,221 +299,156 @@ class StreamripSettings:
 
             action = data[1]
 
-            if action == "main":
-                await self._show_main_menu()
-            elif action == "platforms":
-                await self._show_platforms_menu()
-            elif action == "quality":
-                await self._show_quality_menu()
-            elif action == "download":
-                await self._show_download_menu()
-            elif action == "platform":
-                if len(data) >= 3:
-                    self.current_platform = data[2]
-                    await self._show_platform_config(data[2])
-            elif action == "set":
-                if len(data) >= 4:
-                    await self._handle_setting_change(data[2], data[3])
-            elif action == "toggle":
-                if len(data) >= 3:
-                    await self._handle_toggle(data[2])
-            elif action == "save":
-                await self._save_settings()
-            elif action == "close":
-                await self._close_settings()
-            else:
+            handler = self._actions.get(action)
+            if handler is None:
                 LOGGER.warning(f"Unknown settings action: {action}")
+                return
+
+            coro = handler(data)
+            if coro is not None:
+                await coro
 
         except Exception as e:
             LOGGER.error(f"Error handling settings callback: {e}")
 
+    async def _select_platform(self, platform):
+        """Remember and render the chosen platform page"""
+        self.current_platform = platform
+        await self._show_platform_config(platform)
+
     async def _show_main_menu(self):
         """Show main settings menu"""
-        from utils.button_build import ButtonMaker
-        from utils.message_utils import send_message, edit_message
-        from config_manager import Config
-
         buttons = ButtonMaker()
 
-        # Main menu message
-        msg = "<b>⚙️ Streamrip Bot Settings</b>\n\n"
-        msg += f"<b>🤖 Bot Status:</b> {'✅ Active' if Config.STREAMRIP_ENABLED else '❌ Disabled'}\n"
-        msg += f"<b>👤 Owner:</b> <code>{Config.OWNER_ID}</code>\n"
-        msg += f"<b>📁 Download Dir:</b> <code>{Config.DOWNLOAD_DIR}</code>\n\n"
-
         # Platform status
-        from streamrip_utils.streamrip_config import streamrip_config
         platform_status = streamrip_config.get_platform_status()
-        
-        msg += "<b>🎵 Platform Status:</b>\n"
-        msg += f"🟦 Qobuz: {'✅' if platform_status.get('qobuz') else '❌'}\n"
-        msg += f"⚫ Tidal: {'✅' if platform_status.get('tidal') else '❌'}\n"
-        msg += f"🟣 Deezer: {'✅' if platform_status.get('deezer') else '❌'}\n"
-        msg += f"🟠 SoundCloud: {'✅' if platform_status.get('soundcloud') else '❌'}\n\n"
 
-        # Menu buttons
-        buttons.data_button("🎵 Platform Settings", "settings_platforms")
-        buttons.data_button("📊 Quality Settings", "settings_quality")
-        buttons.data_button("📥 Download Settings", "settings_download")
-        buttons.data_button("💾 Save Changes", "settings_save", "footer")
-        buttons.data_button("❌ Close", "settings_close", "footer")
+        msg = _MAIN_TPL.format(
+            status="✅ Active" if Config.STREAMRIP_ENABLED else "❌ Disabled",
+            owner=Config.OWNER_ID,
+            download_dir=Config.DOWNLOAD_DIR,
+            qobuz="✅" if platform_status.get("qobuz") else "❌",
+            tidal="✅" if platform_status.get("tidal") else "❌",
+            deezer="✅" if platform_status.get("deezer") else "❌",
+            soundcloud="✅" if platform_status.get("soundcloud") else "❌",
+            timeout=self._get_readable_time(
+                self._timeout - (monotonic() - self._time)
+            ),
+        )
 
-        msg += f"<b>⏱️ Session timeout:</b> <code>{self._get_readable_time(self._timeout - (time() - self._time))}</code>"
+        # Menu buttons
+        _add_buttons(buttons, _MAIN_BUTTONS)
 
         # Send or edit message
         if self._reply_to and hasattr(self._reply_to, "edit"):
-            await edit_message(self._reply_to, msg, buttons.build_menu(1))
+            await edit_message(self._reply_to, msg, buttons.build_menu())
         else:
             self._reply_to = await send_message(
-                self.listener.message, msg, buttons.build_menu(1)
+                self.listener.message, msg, buttons.build_menu()
             )
 
     async def _show_platforms_menu(self):
         """Show platform configuration menu"""
-        from utils.button_build import ButtonMaker
-        from utils.message_utils import edit_message
-
         buttons = ButtonMaker()
 
-        msg = "<b>🎵 Platform Configuration</b>\n\n"
-        msg += "Configure streaming platform credentials:\n\n"
+        msg = _PLATFORMS_MSG
 
-        # Platform buttons
-        buttons.data_button("🟦 Qobuz Settings", "settings_platform_qobuz")
-        buttons.data_button("⚫ Tidal Settings", "settings_platform_tidal")
-        buttons.data_button("🟣 Deezer Settings", "settings_platform_deezer")
-        buttons.data_button("🟠 SoundCloud Settings", "settings_platform_soundcloud")
+        # Platform buttons plus navigation
+        _add_buttons(buttons, _PLATFORMS_BUTTONS)
 
-        # Navigation
-        buttons.data_button("⬅️ Back", "settings_main", "footer")
-        buttons.data_button("❌ Close", "settings_close", "footer")
-
-        await edit_message(self._reply_to, msg, buttons.build_menu(1))
+        await edit_message(self._reply_to, msg, buttons.build_menu())
 
     async def _show_quality_menu(self):
         """Show quality settings menu"""
-        from utils.button_build import ButtonMaker
-        from utils.message_utils import edit_message
-        from config_manager import Config
+        buttons = ButtonMaker(2)
 
-        buttons = ButtonMaker()
+        # Snapshot the Config fields this render needs into locals
+        default_quality = Config.STREAMRIP_DEFAULT_QUALITY
+        default_codec = Config.STREAMRIP_DEFAULT_CODEC
 
-        msg = "<b>📊 Quality Settings</b>\n\n"
-        msg += f"<b>Default Quality:</b> <code>{Config.STREAMRIP_DEFAULT_QUALITY}</code>\n"
-        msg += f"<b>Default Codec:</b> <code>{Config.STREAMRIP_DEFAULT_CODEC}</code>\n"
-        msg += f"<b>Fallback Quality:</b> <code>{Config.STREAMRIP_FALLBACK_QUALITY}</code>\n\n"
+        msg = _QUALITY_TPL.format(
+            quality=default_quality,
+            codec=default_codec,
+            fallback=Config.STREAMRIP_FALLBACK_QUALITY,
+        )
 
         # Quality level buttons
         for quality in range(5):
-            quality_names = ["128kbps", "320kbps", "CD", "Hi-Res", "Hi-Res+"]
-            current = "✅" if quality == Config.STREAMRIP_DEFAULT_QUALITY else ""
+            current = "✅" if quality == default_quality else ""
             buttons.data_button(
-                f"{current} {quality}: {quality_names[quality]}",
+                f"{current} {quality}: {_QUALITY_NAMES[quality]}",
                 f"settings_set_quality_{quality}"
             )
 
         # Codec buttons
-        msg += "<b>Available Codecs:</b>\n"
-        for codec in Config.STREAMRIP_SUPPORTED_CODECS:
-            current = "✅" if codec == Config.STREAMRIP_DEFAULT_CODEC else ""
+        for codec in sorted(Config.STREAMRIP_SUPPORTED_CODECS):
+            current = "✅" if codec == default_codec else ""
             buttons.data_button(
                 f"{current} {codec.upper()}",
                 f"settings_set_codec_{codec}"
             )
 
         # Navigation
-        buttons.data_button("⬅️ Back", "settings_main", "footer")
-        buttons.data_button("❌ Close", "settings_close", "footer")
+        _add_buttons(buttons, _NAV_BUTTONS)
 
-        await edit_message(self._reply_to, msg, buttons.build_menu(2))
+        await edit_message(self._reply_to, msg, buttons.build_menu())
 
     async def _show_download_menu(self):
         """Show download settings menu"""
-        from utils.button_build import ButtonMaker
-        from utils.message_utils import edit_message
-        from config_manager import Config
-
-        buttons = ButtonMaker()
-
-        msg = "<b>📥 Download Settings</b>\n\n"
-        msg += f"<b>Download Directory:</b>\n<code>{Config.DOWNLOAD_DIR}</code>\n\n"
-        msg += f"<b>Concurrent Downloads:</b> <code>{Config.STREAMRIP_CONCURRENT_DOWNLOADS}</code>\n"
-        msg += f"<b>Max Search Results:</b> <code>{Config.STREAMRIP_MAX_SEARCH_RESULTS}</code>\n"
-        msg += f"<b>Database Enabled:</b> {'✅' if Config.STREAMRIP_ENABLE_DATABASE else '❌'}\n"
-        msg += f"<b>Auto Convert:</b> {'✅' if Config.STREAMRIP_AUTO_CONVERT else '❌'}\n\n"
+        buttons = ButtonMaker(2)
+
+        # Snapshot the Config fields this render needs into locals
+        concurrent = Config.STREAMRIP_CONCURRENT_DOWNLOADS
+        database = Config.STREAMRIP_ENABLE_DATABASE
+        convert = Config.STREAMRIP_AUTO_CONVERT
+
+        msg = _DOWNLOAD_TPL.format(
+            download_dir=Config.DOWNLOAD_DIR,
+            concurrent=concurrent,
+            max_results=Config.STREAMRIP_MAX_SEARCH_RESULTS,
+            database="✅" if database else "❌",
+            convert="✅" if convert else "❌",
+        )
 
         # Toggle buttons
         buttons.data_button(
-            f"{'✅' if Config.STREAMRIP_ENABLE_DATABASE else '❌'} Database",
+            f"{'✅' if database else '❌'} Database",
             "settings_toggle_database"
         )
         buttons.data_button(
-            f"{'✅' if Config.STREAMRIP_AUTO_CONVERT else '❌'} Auto Convert",
+            f"{'✅' if convert else '❌'} Auto Convert",
             "settings_toggle_convert"
         )
 
         # Concurrent downloads
         for count in [2, 4, 6, 8]:
-            current = "✅" if count == Config.STREAMRIP_CONCURRENT_DOWNLOADS else ""
+            current = "✅" if count == concurrent else ""
             buttons.data_button(
                 f"{current} {count} Concurrent",
                 f"settings_set_concurrent_{count}"
             )
 
         # Navigation
-        buttons.data_button("⬅️ Back", "settings_main", "footer")
-        buttons.data_button("❌ Close", "settings_close", "footer")
+        _add_buttons(buttons, _NAV_BUTTONS)
 
-        await edit_message(self._reply_to, msg, buttons.build_menu(2))
+        await edit_message(self._reply_to, msg, buttons.build_menu())
 
     async def _show_platform_config(self, platform):
         """Show specific platform configuration"""
-        from utils.button_build import ButtonMaker
-        from utils.message_utils import edit_message
-        from config_manager import Config
-
-        buttons = ButtonMaker()
-
-        platform_info = {
-            "qobuz": {
-                "name": "🟦 Qobuz",
-                "email": Config.STREAMRIP_QOBUZ_EMAIL,
-                "password": "***" if Config.STREAMRIP_QOBUZ_PASSWORD else "",
-                "enabled": Config.STREAMRIP_QOBUZ_ENABLED,
-                "quality": Config.STREAMRIP_QOBUZ_QUALITY,
-            },
-            "tidal": {
-                "name": "⚫ Tidal",
-                "token": "***" if Config.STREAMRIP_TIDAL_ACCESS_TOKEN else "",
-                "enabled": Config.STREAMRIP_TIDAL_ENABLED,
-                "quality": Config.STREAMRIP_TIDAL_QUALITY,
-            },
-            "deezer": {
-                "name": "🟣 Deezer",
-                "arl": "***" if Config.STREAMRIP_DEEZER_ARL else "",
-                "enabled": Config.STREAMRIP_DEEZER_ENABLED,
-                "quality": Config.STREAMRIP_DEEZER_QUALITY,
-            },
-            "soundcloud": {
-                "name": "🟠 SoundCloud",
-                "enabled": Config.STREAMRIP_SOUNDCLOUD_ENABLED,
-                "quality": Config.STREAMRIP_SOUNDCLOUD_QUALITY,
-            },
-        }
-
-        info = platform_info.get(platform, {})
-        msg = f"<b>{info.get('name', platform.title())} Configuration</b>\n\n"
-
-        if platform == "qobuz":
-            msg += f"<b>Email:</b> <code>{info.get('email', 'Not set')}</code>\n"
-            msg += f"<b>Password:</b> <code>{info.get('password', 'Not set')}</code>\n"
-        elif platform == "tidal":
-            msg += f"<b>Access Token:</b> <code>{info.get('token', 'Not set')}</code>\n"
-        elif platform == "deezer":
-            msg += f"<b>ARL Cookie:</b> <code>{info.get('arl', 'Not set')}</code>\n"
-
-        msg += f"<b>Enabled:</b> {'✅' if info.get('enabled') else '❌'}\n"
-        msg += f"<b>Quality:</b> <code>{info.get('quality', 0)}</code>\n\n"
+        buttons = ButtonMaker(2)
+
+        # Build info for the requested platform only; rendering one page
+        # shouldn't touch every platform's credentials
+        builder = _PLATFORM_INFO_BUILDERS.get(platform)
+        info = builder() if builder else {}
+
+        cred_tpl = _CRED_TPLS.get(platform)
+        msg = _PLATFORM_TPL.format(
+            name=info.get("name", platform.title()),
+            cred_lines=cred_tpl.format_map(info) if cred_tpl and info else "",
+            enabled="✅" if info.get("enabled") else "❌",
+            quality=info.get("quality", 0),
+        )
 
         # Toggle enabled/disabled
         buttons.data_button(
@@ -326,84 +466,85 @@ class StreamripSettings:
             )
 
         # Navigation
-        buttons.data_button("⬅️ Back to Platforms", "settings_platforms", "footer")
-        buttons.data_button("❌ Close", "settings_close", "footer")
+        _add_buttons(buttons, _PLATFORM_NAV_BUTTONS)
 
-        await edit_message(self._reply_to, msg, buttons.build_menu(2))
+        await edit_message(self._reply_to, msg, buttons.build_menu())
 
     async def _handle_setting_change(self, setting_type, value):
         """Handle setting change"""
-        from config_manager import Config
-
         try:
             if setting_type == "quality":
                 Config.STREAMRIP_DEFAULT_QUALITY = int(value)
-                self._changes_made = True
-                await self._show_quality_menu()
+                menu = self._show_quality_menu()
             elif setting_type == "codec":
                 Config.STREAMRIP_DEFAULT_CODEC = value
-                self._changes_made = True
-                await self._show_quality_menu()
+                menu = self._show_quality_menu()
             elif setting_type == "concurrent":
                 Config.STREAMRIP_CONCURRENT_DOWNLOADS = int(value)
-                self._changes_made = True
-                await self._show_download_menu()
-            elif "_quality_" in setting_type:
-                platform, _, quality = setting_type.partition("_quality_")
-                quality = int(quality)
-                
-                if platform == "qobuz":
-                    Config.STREAMRIP_QOBUZ_QUALITY = quality
-                elif platform == "tidal":
-                    Config.STREAMRIP_TIDAL_QUALITY = quality
-                elif platform == "deezer":
-                    Config.STREAMRIP_DEEZER_QUALITY = quality
-                elif platform == "soundcloud":
-                    Config.STREAMRIP_SOUNDCLOUD_QUALITY = quality
-                
-                self._changes_made = True
-                await self._show_platform_config(platform)
+                menu = self._show_download_menu()
+            else:
+                # Per-platform quality: setting_type is "{platform}_quality"
+                platform, _, tail = setting_type.partition("_")
+                attr = _QUALITY_ATTRS.get(platform) if tail == "quality" else None
+                if attr is None:
+                    return
+                setattr(Config, attr, int(value))
+                menu = self._show_platform_config(platform)
+
+            self._changes_made = True
+            await menu
 
         except Exception as e:
             LOGGER.error(f"Error handling setting change: {e}")
 
     async def _handle_toggle(self, setting):
         """Handle toggle setting"""
-        from config_manager import Config
+        attr = _TOGGLES.get(setting)
+        if attr is None:
+            return
 
         try:
-            if setting == "database":
-                Config.STREAMRIP_ENABLE_DATABASE = not Config.STREAMRIP_ENABLE_DATABASE
-                self._changes_made = True
-                await self._show_download_menu()
-            elif setting == "convert":
-                Config.STREAMRIP_AUTO_CONVERT = not Config.STREAMRIP_AUTO_CONVERT
-                self._changes_made = True
-                await self._show_download_menu()
-            elif setting == "qobuz":
-                Config.STREAMRIP_QOBUZ_ENABLED = not Config.STREAMRIP_QOBUZ_ENABLED
-                self._changes_made = True
-                await self._show_platform_config("qobuz")
-            elif setting == "tidal":
-                Config.STREAMRIP_TIDAL_ENABLED = not Config.STREAMRIP_TIDAL_ENABLED
-                self._changes_made = True
-                await self._show_platform_config("tidal")
-            elif setting == "deezer":
-                Config.STREAMRIP_DEEZER_ENABLED = not Config.STREAMRIP_DEEZER_ENABLED
-                self._changes_made = True
-                await self._show_platform_config("deezer")
-            elif setting == "soundcloud":
-                Config.STREAMRIP_SOUNDCLOUD_ENABLED = not Config.STREAMRIP_SOUNDCLOUD_ENABLED
-                self._changes_made = True
-                await self._show_platform_config("soundcloud")
+            setattr(Config, attr, not getattr(Config, attr))
+            self._changes_made = True
+
+            if setting in ("database", "convert"):
+                self._schedule_render(("download", None))
+            else:
+                streamrip_config.invalidate_platform_status()
+                self._schedule_render(("platform", setting))
 
         except Exception as e:
             LOGGER.error(f"Error handling toggle: {e}")
 
+    def _schedule_render(self, menu):
+        """Record the menu to render and kick off a debounced edit;
+        rapid toggles just overwrite the target until the window closes"""
+        self._latest_menu = menu
+        if self._pending_render is None or self._pending_render.done():
+            self._pending_render = asyncio.create_task(self._debounced_render())
+
+    async def _debounced_render(self):
+        """Apply the most recent menu state after the debounce window;
+        loops until the target is unchanged after an edit, so a toggle
+        that lands while the message edit is in flight (when
+        _schedule_render sees the task as not done and schedules
+        nothing) is still rendered instead of being dropped"""
+        try:
+            while True:
+                await asyncio.sleep(_DEBOUNCE_WINDOW)
+                rendered = self._latest_menu
+                menu, arg = rendered
+                if menu == "platform":
+                    await self._show_platform_config(arg)
+                else:
+                    await self._show_download_menu()
+                if self._latest_menu == rendered:
+                    return
+        except Exception as e:
+            LOGGER.error(f"Error rendering settings menu: {e}")
+
     async def _save_settings(self):
         """Save current settings"""
-        from utils.message_utils import send_message, delete_message
-
         try:
             # Here you would implement actual saving to config file or database
             # For now, just show confirmation
@@ -425,15 +566,12 @@ class StreamripSettings:
 
     async def _close_settings(self):
         """Close settings menu"""
-        from utils.message_utils import delete_message
-
         try:
             # Delete settings menu
             if self._reply_to and hasattr(self._reply_to, "delete"):
                 await delete_message(self._reply_to)
 
             if self._changes_made:
-                from utils.message_utils import send_message
                 await send_message(
                     self.listener.message,
                     f"{self.listener.tag} ⚠️ <b>Settings closed with unsaved changes!</b>\n\n"
@@ -449,10 +587,9 @@ class StreamripSettings:
         """Convert seconds to readable time format"""
         if seconds <= 0:
             return "0s"
-        
-        minutes = int(seconds // 60)
-        seconds = int(seconds % 60)
-        
+
+        minutes, seconds = divmod(int(seconds), 60)
+
         if minutes > 0:
             return f"{minutes}m {seconds}s"
         return f"{seconds}s"
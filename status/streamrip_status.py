@@ -1,3 +1,4 @@
+import sys
 import time
 from logging import getLogger
 
@@ -5,16 +6,26 @@ LOGGER = getLogger(__name__)
 
 
 class MirrorStatus:
-    """Status constants for downloads"""
-    STATUS_DOWNLOAD = "Downloading"
-    STATUS_UPLOAD = "Uploading"
-    STATUS_QUEUEDL = "Queued Download"
-    STATUS_QUEUEUP = "Queued Upload"
-    STATUS_PAUSED = "Paused"
-    STATUS_ARCHIVING = "Archiving"
-    STATUS_EXTRACTING = "Extracting"
-    STATUS_CLONING = "Cloning"
-    STATUS_SEEDING = "Seeding"
+    """Status constants for downloads; interned so equality checks
+    and the _STATUS_LINES lookups resolve on identity"""
+    STATUS_DOWNLOAD = sys.intern("Downloading")
+    STATUS_UPLOAD = sys.intern("Uploading")
+    STATUS_QUEUEDL = sys.intern("Queued Download")
+    STATUS_QUEUEUP = sys.intern("Queued Upload")
+    STATUS_PAUSED = sys.intern("Paused")
+    STATUS_ARCHIVING = sys.intern("Archiving")
+    STATUS_EXTRACTING = sys.intern("Extracting")
+    STATUS_CLONING = sys.intern("Cloning")
+    STATUS_SEEDING = sys.intern("Seeding")
+
+
+# Readable status lines with the elapsed time left as a placeholder,
+# so cached renders only have to substitute the one changing field
+_STATUS_LINES = {
+    MirrorStatus.STATUS_DOWNLOAD: "📥 Downloading • {elapsed}",
+    MirrorStatus.STATUS_QUEUEDL: "⏳ Queued • {elapsed}",
+    MirrorStatus.STATUS_PAUSED: "⏸️ Cancelled • {elapsed}",
+}
 
 
 class StreamripDownloadStatus:
@@ -24,8 +35,10 @@ class StreamripDownloadStatus:
         self.listener = listener
         self.download_helper = download_helper
         self.queued = queued
-        self._start_time = time.time()
+        self._start_time = time.monotonic()
         self.tool = "streamrip"  # Required by status system
+        self._cached_parts = None
+        self._cached_key = None
 
     def gid(self):
         """Get unique identifier"""
@@ -41,17 +54,10 @@ class StreamripDownloadStatus:
 
     def name(self):
         """Get download name"""
-        if (
-            hasattr(self.download_helper, "_current_track")
-            and self.download_helper._current_track
-        ):
-            return self.download_helper._current_track
-        if (
-            hasattr(self.download_helper, "current_track")
-            and self.download_helper.current_track
-        ):
-            return self.download_helper.current_track
-        return self.listener.name or "Streamrip Download"
+        track = getattr(self.download_helper, "_current_track", None) or getattr(
+            self.download_helper, "current_track", None
+        )
+        return track or self.listener.name or "Streamrip Download"
 
     def size(self):
         """Get total size"""
@@ -79,7 +85,7 @@ class StreamripDownloadStatus:
 
     def elapsed_time(self):
         """Get elapsed time"""
-        return time.time() - self._start_time
+        return time.monotonic() - self._start_time
 
     def engine(self):
         """Get download engine"""
@@ -118,31 +124,19 @@ class StreamripDownloadStatus:
     def get_readable_status(self):
         """Get human-readable status"""
         status = self.status()
-        elapsed = self.elapsed_time()
-        
-        elapsed_str = self._format_time(elapsed)
-        
-        if status == MirrorStatus.STATUS_DOWNLOAD:
-            return f"📥 Downloading • {elapsed_str}"
-        elif status == MirrorStatus.STATUS_QUEUEDL:
-            return f"⏳ Queued • {elapsed_str}"
-        elif status == MirrorStatus.STATUS_PAUSED:
-            return f"⏸️ Cancelled • {elapsed_str}"
-        else:
-            return f"{status} • {elapsed_str}"
+        line = _STATUS_LINES.get(status, f"{status} • {{elapsed}}")
+        return line.format(elapsed=self._format_time(self.elapsed_time()))
 
     def _format_time(self, seconds):
         """Format time in seconds to readable format"""
-        if seconds < 60:
-            return f"{int(seconds)}s"
-        elif seconds < 3600:
-            minutes = int(seconds // 60)
-            secs = int(seconds % 60)
-            return f"{minutes}m {secs}s"
-        else:
-            hours = int(seconds // 3600)
-            minutes = int((seconds % 3600) // 60)
+        hours, rem = divmod(int(seconds), 3600)
+        minutes, secs = divmod(rem, 60)
+
+        if hours:
             return f"{hours}h {minutes}m"
+        if minutes:
+            return f"{minutes}m {secs}s"
+        return f"{secs}s"
 
     def get_progress_bar(self, length=20):
         """Get progress bar (not applicable for streamrip)"""
@@ -150,11 +144,28 @@ class StreamripDownloadStatus:
 
     def get_status_message(self):
         """Get formatted status message"""
-        msg = f"<b>🎵 {self.name()}</b>\n"
-        msg += f"<b>📊 Status:</b> {self.get_readable_status()}\n"
-        msg += f"<b>🔧 Engine:</b> {self.engine()}\n"
-        msg += f"<b>📁 Size:</b> {self.size()}\n"
-        msg += f"<b>⚡ Speed:</b> {self.speed()}\n"
-        msg += f"<b>⏱️ ETA:</b> {self.eta()}\n"
-        msg += f"<b>📈 Progress:</b> {self.progress()}"
-        return msg
+        # Everything except the elapsed time is fixed until the status
+        # or track name changes, so cache the text before and after the
+        # elapsed field and splice it in with plain concatenation; track
+        # titles and -n names can contain braces, so .format on a string
+        # embedding them would raise
+        status = self.status()
+        name = self.name()
+        key = (status, name)
+
+        if key != self._cached_key:
+            status_line = _STATUS_LINES.get(status, f"{status} • {{elapsed}}")
+            head, _, tail = status_line.partition("{elapsed}")
+            self._cached_parts = (
+                f"<b>🎵 {name}</b>\n<b>📊 Status:</b> {head}",
+                f"{tail}\n"
+                f"<b>🔧 Engine:</b> {self.engine()}\n"
+                f"<b>📁 Size:</b> {self.size()}\n"
+                f"<b>⚡ Speed:</b> {self.speed()}\n"
+                f"<b>⏱️ ETA:</b> {self.eta()}\n"
+                f"<b>📈 Progress:</b> {self.progress()}",
+            )
+            self._cached_key = key
+
+        before, after = self._cached_parts
+        return before + self._format_time(self.elapsed_time()) + after
@@ -275,10 +275,10 @@ class StreamripQualitySelector:
         # Send or edit message
         try:
             if self._reply_to and hasattr(self._reply_to, "edit"):
-                await edit_message(self._reply_to, msg, buttons.build_menu(1))
+                await edit_message(self._reply_to, msg, buttons.build_menu())
             else:
                 self._reply_to = await send_message(
-                    self.listener.message, msg, buttons.build_menu(1)
+                    self.listener.message, msg, buttons.build_menu()
                 )
         except Exception as e:
             LOGGER.error(f"Error sending/editing message: {e}")
@@ -314,7 +314,7 @@ class StreamripQualitySelector:
 
         # Only edit if it's a valid message object
         if self._reply_to and hasattr(self._reply_to, "edit"):
-            await edit_message(self._reply_to, msg, buttons.build_menu(1))
+            await edit_message(self._reply_to, msg, buttons.build_menu())
 
     async def _finalize_selection(self):
         """Finalize the selection and close interface"""
@@ -1,8 +1,11 @@
 import asyncio
-from time import time
+from time import monotonic
+from types import MappingProxyType
 from typing import Any
 from logging import getLogger
 
+from config_manager import Config
+
 LOGGER = getLogger(__name__)
 
 try:
@@ -31,24 +34,74 @@ except ImportError:
         pass
 
 
-class StreamripSearchHandler:
-    """Multi-platform search handler for streamrip"""
-
-    # Platform search types
-    PLATFORM_SEARCH_TYPES = {
+# Logged-in clients are reused across searches: login is the slow part
+# of search startup, and the underlying aiohttp sessions stay valid for
+# a while. Entries map platform name -> (client, login task, creation
+# timestamp); caching the task lets concurrent searches share one
+# in-flight login instead of serializing behind the lock, which is held
+# only for cache reads and inserts — never across the network round trip.
+_CLIENT_CACHE: dict[str, tuple[Any, asyncio.Task, float]] = {}
+_CACHE_LOCK = asyncio.Lock()
+_CLIENT_TTL = 1800  # seconds a cached login is trusted
+
+
+def invalidate_cached_client(platform: str):
+    """Drop a cached client so the next search performs a fresh login"""
+    _CLIENT_CACHE.pop(platform, None)
+
+
+# Message templates rendered with one .format call per search instead
+# of rebuilding the multi-line literals inside the coroutine
+_NO_PLATFORMS_MSG = (
+    "{tag} ❌ <b>No streamrip platforms are configured!</b>\n\n"
+    "🎵 <b>Available platforms:</b>\n"
+    "🟦 <code>Qobuz</code> - Hi-Res FLAC\n"
+    "⚫ <code>Tidal</code> - MQA/Hi-Res\n"
+    "🟣 <code>Deezer</code> - CD Quality\n"
+    "🟠 <code>SoundCloud</code> - MP3 320kbps\n\n"
+    "💡 <i>Configure credentials in bot settings to enable search.</i>"
+)
+
+_SEARCHING_TPL = (
+    "{tag} 🔍 <b>Searching for:</b> <code>{query}</code>\n\n"
+    "🎵 <b>Platforms:</b> {platforms}\n"
+    "⏳ <i>Please wait...</i>"
+)
+
+_NO_RESULTS_TPL = (
+    "{tag} ❌ <b>No results found for:</b> <code>{query}</code>\n\n"
+    "💡 <i>Try different keywords or check spelling.</i>"
+)
+
+
+# Platform search types (read-only)
+_PLATFORM_SEARCH_TYPES = MappingProxyType(
+    {
         "qobuz": ("track", "album", "artist", "playlist"),
         "deezer": ("track", "album", "artist", "playlist"),
         "tidal": ("track", "album", "artist", "playlist"),
         "soundcloud": ("track",),
     }
+)
 
-    # Platform emojis
-    PLATFORM_EMOJIS = {
+# Platform emojis (read-only)
+_PLATFORM_EMOJIS = MappingProxyType(
+    {
         "qobuz": "🟦",
         "tidal": "⚫",
         "deezer": "🟣",
         "soundcloud": "🟠",
     }
+)
+
+
+class StreamripSearchHandler:
+    """Multi-platform search handler for streamrip"""
+
+    # Aliases kept for external readers; the hot paths use the module
+    # globals directly
+    PLATFORM_SEARCH_TYPES = _PLATFORM_SEARCH_TYPES
+    PLATFORM_EMOJIS = _PLATFORM_EMOJIS
 
     def __init__(
         self,
@@ -64,21 +117,35 @@ class StreamripSearchHandler:
         self.media_type_filter = media_type_filter
         self.result_limit = result_limit
         self.search_results = {}
+        self._total_results = 0
         self.current_page = 0
         self.results_per_page = 5
         self._reply_to = None
-        self._time = time()
         self._timeout = 300  # 5 minutes for search
         self.event = asyncio.Event()
         self.selected_result = None
         self.clients = {}
 
+        # The media filter is fixed for the handler's lifetime, so the
+        # effective search types per platform can be resolved once here
+        # instead of on every platform search
+        if media_type_filter:
+            self._effective_types = {
+                p: ((media_type_filter,) if media_type_filter in types else ())
+                for p, types in _PLATFORM_SEARCH_TYPES.items()
+            }
+        else:
+            self._effective_types = _PLATFORM_SEARCH_TYPES
+
+        # Four platforms x four search types would put 16 requests in
+        # flight at once; cap them so parallelism doesn't turn into
+        # upstream rate-limit retries
+        self._search_sem = asyncio.Semaphore(Config.STREAMRIP_SEARCH_CONCURRENCY)
+
     async def initialize_clients(self) -> bool:
         """Initialize streamrip clients for available platforms"""
         if not STREAMRIP_AVAILABLE:
             return False
-
-        from config_manager import Config
         from streamrip_utils.streamrip_config import streamrip_config
 
         # Initialize streamrip config
@@ -89,48 +156,74 @@ class StreamripSearchHandler:
         if not config:
             return False
 
-        # Initialize clients based on available credentials
+        # Initialize clients based on available credentials; construction
+        # is cheap, so build them all first and run the network logins
+        # concurrently instead of serially
         try:
+            pending = []
+
             # Qobuz
             if (
                 Config.STREAMRIP_QOBUZ_ENABLED
                 and Config.STREAMRIP_QOBUZ_EMAIL
                 and Config.STREAMRIP_QOBUZ_PASSWORD
             ):
-                try:
-                    self.clients["qobuz"] = QobuzClient(config.session.qobuz)
-                    await self.clients["qobuz"].login()
-                except Exception as e:
-                    LOGGER.warning(f"Failed to initialize Qobuz client: {e}")
+                pending.append(("qobuz", QobuzClient, config.session.qobuz))
 
             # Tidal
             if (
                 Config.STREAMRIP_TIDAL_ENABLED
                 and Config.STREAMRIP_TIDAL_ACCESS_TOKEN
             ):
-                try:
-                    self.clients["tidal"] = TidalClient(config.session.tidal)
-                    await self.clients["tidal"].login()
-                except Exception as e:
-                    LOGGER.warning(f"Failed to initialize Tidal client: {e}")
+                pending.append(("tidal", TidalClient, config.session.tidal))
 
             # Deezer
             if Config.STREAMRIP_DEEZER_ENABLED and Config.STREAMRIP_DEEZER_ARL:
-                try:
-                    self.clients["deezer"] = DeezerClient(config.session.deezer)
-                    await self.clients["deezer"].login()
-                except Exception as e:
-                    LOGGER.warning(f"Failed to initialize Deezer client: {e}")
+                pending.append(("deezer", DeezerClient, config.session.deezer))
 
             # SoundCloud
             if Config.STREAMRIP_SOUNDCLOUD_ENABLED:
-                try:
-                    self.clients["soundcloud"] = SoundcloudClient(
-                        config.session.soundcloud
+                pending.append(
+                    ("soundcloud", SoundcloudClient, config.session.soundcloud)
+                )
+
+            # Under the lock: reuse TTL-fresh entries and start a login
+            # task for the rest. No await happens while it is held, so a
+            # slow or hung login on one search never blocks another
+            # search's cache access.
+            entries = []
+            async with _CACHE_LOCK:
+                now = monotonic()
+                for platform_name, client_cls, session_config in pending:
+                    cached = _CLIENT_CACHE.get(platform_name)
+                    if cached is None or now - cached[2] >= _CLIENT_TTL:
+                        client = client_cls(session_config)
+                        cached = (client, asyncio.create_task(client.login()), now)
+                        _CLIENT_CACHE[platform_name] = cached
+                    entries.append((platform_name, cached))
+
+            # Await the (possibly shared) login tasks outside the lock;
+            # a task that already finished for an earlier search resolves
+            # immediately here
+            login_results = await asyncio.gather(
+                *(task for _, (_, task, _) in entries),
+                return_exceptions=True,
+            )
+
+            for (platform_name, (client, task, _ts)), result in zip(
+                entries, login_results
+            ):
+                if isinstance(result, Exception):
+                    LOGGER.warning(
+                        f"Failed to initialize {platform_name.title()} client: {result}"
                     )
-                    await self.clients["soundcloud"].login()
-                except Exception as e:
-                    LOGGER.warning(f"Failed to initialize SoundCloud client: {e}")
+                    # Drop the failed entry unless another search has
+                    # already replaced it with a fresh login
+                    current = _CLIENT_CACHE.get(platform_name)
+                    if current is not None and current[1] is task:
+                        del _CLIENT_CACHE[platform_name]
+                else:
+                    self.clients[platform_name] = client
 
         except Exception as e:
             LOGGER.error(f"Error initializing streamrip clients: {e}")
@@ -140,18 +233,15 @@ class StreamripSearchHandler:
     async def search(self) -> dict[str, Any] | None:
         """Perform multi-platform search"""
         try:
-            if not await self.initialize_clients():
+            # Read self.clients directly: it is the real ready signal,
+            # and an empty dict must not reach the gather below
+            await self.initialize_clients()
+            if not self.clients:
                 from utils.message_utils import send_message
 
                 await send_message(
                     self.listener.message,
-                    f"{self.listener.tag} ❌ <b>No streamrip platforms are configured!</b>\n\n"
-                    f"🎵 <b>Available platforms:</b>\n"
-                    f"🟦 <code>Qobuz</code> - Hi-Res FLAC\n"
-                    f"⚫ <code>Tidal</code> - MQA/Hi-Res\n"
-                    f"🟣 <code>Deezer</code> - CD Quality\n"
-                    f"🟠 <code>SoundCloud</code> - MP3 320kbps\n\n"
-                    f"💡 <i>Configure credentials in bot settings to enable search.</i>",
+                    _NO_PLATFORMS_MSG.format(tag=self.listener.tag),
                 )
                 return None
 
@@ -160,35 +250,26 @@ class StreamripSearchHandler:
 
             search_msg = await send_message(
                 self.listener.message,
-                f"{self.listener.tag} 🔍 <b>Searching for:</b> <code>{self.query}</code>\n\n"
-                f"🎵 <b>Platforms:</b> {', '.join(self.clients.keys())}\n"
-                f"⏳ <i>Please wait...</i>",
+                _SEARCHING_TPL.format(
+                    tag=self.listener.tag,
+                    query=self.query,
+                    platforms=", ".join(self.clients),
+                ),
             )
 
             # Perform search on all platforms or specific platform
-            if self.platform and self.platform in self.clients:
-                await self._search_platform(self.platform)
-            else:
-                # Search all available platforms
-                search_tasks = []
-                for platform_name in self.clients:
-                    search_tasks.append(self._search_platform(platform_name))
-
-                await asyncio.gather(*search_tasks, return_exceptions=True)
+            await self._run_searches()
 
             # Delete searching message
             await delete_message(search_msg)
 
             # Check if we have results
-            total_results = sum(
-                len(results) for results in self.search_results.values()
-            )
-
-            if total_results == 0:
+            if self._total_results == 0:
                 await send_message(
                     self.listener.message,
-                    f"{self.listener.tag} ❌ <b>No results found for:</b> <code>{self.query}</code>\n\n"
-                    f"💡 <i>Try different keywords or check spelling.</i>",
+                    _NO_RESULTS_TPL.format(
+                        tag=self.listener.tag, query=self.query
+                    ),
                 )
                 return None
 
@@ -207,6 +288,34 @@ class StreamripSearchHandler:
             LOGGER.error(f"Search error: {e}")
             return None
 
+    async def _run_searches(self):
+        """Search the requested platform, or all initialized platforms
+        concurrently"""
+        if self.platform and self.platform in self.clients:
+            await self._search_platform(self.platform)
+            return
+
+        # _search_platform swallows its own errors, so no child can
+        # abort its siblings; TaskGroup schedules cheaper than gather
+        # and the watchdog lets a user cancel cut the search short
+        # instead of waiting out the slowest platform
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(self._search_platform(name))
+                for name in self.clients
+            ]
+            tg.create_task(self._cancel_watchdog(tasks))
+
+    async def _cancel_watchdog(self, tasks):
+        """Cancel outstanding platform searches once the listener is
+        flagged as cancelled"""
+        while not all(task.done() for task in tasks):
+            if getattr(self.listener, "is_cancelled", False):
+                for task in tasks:
+                    task.cancel()
+                return
+            await asyncio.sleep(0.25)
+
     async def _search_platform(self, platform: str):
         """Search on a specific platform"""
         try:
@@ -217,9 +326,13 @@ class StreamripSearchHandler:
                 # Apply result limit
                 limited_results = results[: self.result_limit]
                 self.search_results[platform] = limited_results
+                self._total_results += len(limited_results)
 
         except Exception as e:
             LOGGER.error(f"Search failed on {platform}: {e}")
+            # A platform-wide failure usually means the cached session
+            # went stale; drop it so the next search logs in fresh
+            invalidate_cached_client(platform)
 
     async def _perform_platform_search(
         self, client, platform: str
@@ -228,45 +341,57 @@ class StreamripSearchHandler:
         results = []
 
         try:
-            # Get search types for this platform
-            search_types = self.PLATFORM_SEARCH_TYPES.get(platform, ("track",))
-
-            # Filter by media type if specified
-            if self.media_type_filter:
-                search_types = (
-                    [self.media_type_filter]
-                    if self.media_type_filter in search_types
-                    else []
-                )
-
-            for search_type in search_types:
-                try:
-                    # Perform search
-                    search_response = await client.search(
+            # Get the precomputed search types for this platform
+            search_types = self._effective_types.get(platform, ("track",))
+
+            if not search_types:
+                return results
+
+            # Only extract what can survive the platform's result limit:
+            # a platform returning 100 items per type would otherwise pay
+            # for hundreds of extractions that get sliced away afterwards
+            per_type_cap = max(1, self.result_limit // len(search_types))
+
+            # Fire all search types at once; they hit independent API
+            # endpoints, so there is no reason to pay each round trip
+            # in sequence. The semaphore keeps the total number of
+            # in-flight requests across platforms bounded.
+            async def _bounded_search(search_type):
+                async with self._search_sem:
+                    return await client.search(
                         search_type,
                         self.query,
                         limit=self.result_limit,
                     )
 
-                    if search_response:
-                        # Extract results based on platform
-                        actual_results = self._extract_results_from_response(
-                            search_response, platform, search_type
-                        )
+            responses = await asyncio.gather(
+                *(_bounded_search(st) for st in search_types),
+                return_exceptions=True,
+            )
 
-                        for item in actual_results:
-                            result = await self._extract_search_result(
-                                item, platform, search_type
-                            )
-                            if result:
-                                results.append(result)
+            # Bind the per-item extractor once; inside the generator this
+            # is a LOAD_FAST per result instead of two attribute lookups
+            extract = self._extract_search_result
 
-                except Exception as search_error:
+            for search_type, search_response in zip(search_types, responses):
+                if isinstance(search_response, Exception):
                     LOGGER.warning(
-                        f"Search type '{search_type}' failed on {platform}: {search_error}"
+                        f"Search type '{search_type}' failed on {platform}: {search_response}"
                     )
                     continue
 
+                if search_response:
+                    # Extract results based on platform
+                    actual_results = self._extract_results_from_response(
+                        search_response, platform, search_type
+                    )
+
+                    results.extend(
+                        result
+                        for item in actual_results[:per_type_cap]
+                        if (result := extract(item, platform, search_type))
+                    )
+
         except Exception as e:
             LOGGER.error(f"Platform search error for {platform}: {e}")
 
@@ -285,29 +410,41 @@ class StreamripSearchHandler:
         else:
             return [response]
 
-    async def _extract_search_result(
+    def _extract_search_result(
         self, item, platform: str, search_type: str
     ) -> dict[str, Any] | None:
         """Extract search result metadata"""
         try:
+            # One __dict__ grab replaces seven attribute probes per item;
+            # slotted objects have no __dict__ and keep the getattr path
+            d = getattr(item, "__dict__", None)
+            if d is None:
+                def get(key, default=None):
+                    return getattr(item, key, default)
+            else:
+                get = d.get
+
+            item_id = get("id", "unknown")
             result = {
                 "platform": platform,
                 "type": search_type,
-                "id": getattr(item, "id", "unknown"),
-                "title": getattr(item, "title", "Unknown Title"),
-                "artist": getattr(item, "artist", "Unknown Artist"),
-                "album": getattr(item, "album", "")
+                "id": item_id,
+                "title": get("title", "Unknown Title"),
+                "artist": get("artist", "Unknown Artist"),
+                "album": get("album", "")
                 if search_type != "album"
-                else getattr(item, "title", ""),
-                "duration": getattr(item, "duration", 0),
-                "url": f"{platform}:{search_type}:{getattr(item, 'id', 'unknown')}",
+                else get("title", ""),
+                "duration": get("duration", 0),
+                "url": f"{platform}:{search_type}:{item_id}",
             }
 
             # Add platform-specific metadata
-            if hasattr(item, "release_date"):
-                result["year"] = getattr(item, "release_date", "")
-            if hasattr(item, "track_count"):
-                result["track_count"] = getattr(item, "track_count", 0)
+            year = get("release_date")
+            if year is not None:
+                result["year"] = year
+            track_count = get("track_count")
+            if track_count is not None:
+                result["track_count"] = track_count
 
             return result
 
@@ -319,9 +456,8 @@ class StreamripSearchHandler:
         """Show search results with pagination"""
         # This would implement the UI for showing search results
         # For now, just log the results
-        total_results = sum(len(results) for results in self.search_results.values())
         LOGGER.info(
-            f"Found {total_results} results across {len(self.search_results)} platforms"
+            f"Found {self._total_results} results across {len(self.search_results)} platforms"
         )
 
     async def _register_handler_and_wait(self):
@@ -369,17 +505,12 @@ async def search_music_auto_first(
     )
 
     # Perform search without UI
-    if not await search_handler.initialize_clients():
+    await search_handler.initialize_clients()
+    if not search_handler.clients:
         return None
 
     # Search all platforms or specific platform
-    if search_handler.platform and search_handler.platform in search_handler.clients:
-        await search_handler._search_platform(search_handler.platform)
-    else:
-        search_tasks = []
-        for platform_name in search_handler.clients:
-            search_tasks.append(search_handler._search_platform(platform_name))
-        await asyncio.gather(*search_tasks, return_exceptions=True)
+    await search_handler._run_searches()
 
     # Return first result
     for platform_results in search_handler.search_results.values():
@@ -1,25 +1,120 @@
+import asyncio
+from importlib.util import find_spec
 from pathlib import Path
 from logging import getLogger
+from typing import TYPE_CHECKING
 
-LOGGER = getLogger(__name__)
+from config_manager import Config
 
-try:
+if TYPE_CHECKING:
     from streamrip.config import Config as StreamripConfig
 
-    STREAMRIP_AVAILABLE = True
-except ImportError:
-    STREAMRIP_AVAILABLE = False
+LOGGER = getLogger(__name__)
+
+# Probe for the package without importing it; streamrip's full import
+# graph is only paid inside initialize() when a download or search
+# actually needs it, not by every bot start that imports this module
+STREAMRIP_AVAILABLE = find_spec("streamrip") is not None
+if not STREAMRIP_AVAILABLE:
     LOGGER.warning("Streamrip not installed. Streamrip features will be disabled.")
 
 
+# Fallback config, used only when the streamrip API cannot build its own
+# defaults; kept as a module constant so the function body stays small
+_DEFAULT_CONFIG_TOML = """\
+[session]
+[session.downloads]
+folder = "/usr/src/app/downloads/"
+concurrency = 4
+
+[session.qobuz]
+quality = 3
+email_or_userid = ""
+password_or_token = ""
+use_auth_token = false
+
+[session.tidal]
+quality = 3
+username = ""
+password = ""
+user_id = ""
+country_code = ""
+access_token = ""
+refresh_token = ""
+token_expiry = ""
+
+[session.deezer]
+quality = 2
+arl = ""
+
+[session.soundcloud]
+quality = 1
+
+[session.youtube]
+quality = 0
+
+[session.conversion]
+enabled = false
+codec = "flac"
+
+[session.database]
+downloads_enabled = true
+failed_downloads_enabled = true
+downloads_path = "~/.config/streamrip/streamrip_downloads.db"
+failed_downloads_path = "~/.config/streamrip/streamrip_failed.db"
+
+[session.filepaths]
+track_format = "{artist} - {title}"
+folder_format = "{artist} - {album}"
+
+[session.artwork]
+embed = true
+save_artwork = false
+embed_size = 1200
+saved_max_width = 1200
+
+[session.metadata]
+exclude = []
+set_playlist_to_album = true
+renumber_playlist_tracks = true
+
+[session.misc]
+max_search_results = 20
+"""
+
+
+# Per-platform quality settings: (session section, Config attribute)
+_PLATFORM_QUALITY = (
+    ("qobuz", "STREAMRIP_QOBUZ_QUALITY"),
+    ("tidal", "STREAMRIP_TIDAL_QUALITY"),
+    ("deezer", "STREAMRIP_DEEZER_QUALITY"),
+    ("soundcloud", "STREAMRIP_SOUNDCLOUD_QUALITY"),
+)
+
+# Credential fields: (session section, field, Config attribute); empty
+# Config values are skipped so streamrip's own defaults survive
+_AUTH_FIELDS = (
+    ("qobuz", "email_or_userid", "STREAMRIP_QOBUZ_EMAIL"),
+    ("qobuz", "password_or_token", "STREAMRIP_QOBUZ_PASSWORD"),
+    ("tidal", "access_token", "STREAMRIP_TIDAL_ACCESS_TOKEN"),
+    ("tidal", "refresh_token", "STREAMRIP_TIDAL_REFRESH_TOKEN"),
+    ("tidal", "user_id", "STREAMRIP_TIDAL_USER_ID"),
+    ("tidal", "country_code", "STREAMRIP_TIDAL_COUNTRY_CODE"),
+    ("deezer", "arl", "STREAMRIP_DEEZER_ARL"),
+)
+
+
 class StreamripConfigHelper:
     """Helper for streamrip configuration management"""
 
     def __init__(self):
-        self.config: StreamripConfig | None = None
+        self.config: "StreamripConfig | None" = None
         self.config_path: Path | None = None
         self._initialized = False
         self._initialization_attempted = False
+        self._platform_status: dict[str, bool] | None = None
+        self._platform_status_version = -1
+        self._last_settings_hash: int | None = None
 
     async def lazy_initialize(self) -> bool:
         """Lazy initialization - only initialize when needed"""
@@ -34,13 +129,9 @@ class StreamripConfigHelper:
 
         if success:
             # Enable streamrip if initialization was successful
-            from config_manager import Config
-
             Config.STREAMRIP_ENABLED = True
         else:
             # Disable streamrip if initialization failed
-            from config_manager import Config
-
             Config.STREAMRIP_ENABLED = False
             LOGGER.warning("❌ Streamrip disabled due to initialization failure")
 
@@ -53,6 +144,8 @@ class StreamripConfigHelper:
             return False
 
         try:
+            from streamrip.config import Config as StreamripConfig
+
             # Use temporary config location
             self.config_path = Path.home() / ".config" / "streamrip" / "config.toml"
 
@@ -87,8 +180,6 @@ class StreamripConfigHelper:
             LOGGER.error(f"Failed to initialize streamrip config: {e}")
             LOGGER.warning("Streamrip will be disabled due to configuration errors")
             # Disable streamrip if initialization fails
-            from config_manager import Config
-
             Config.STREAMRIP_ENABLED = False
             self._initialized = False
             self.config = None
@@ -96,72 +187,18 @@ class StreamripConfigHelper:
 
     async def _create_default_config_file(self):
         """Create a default streamrip config file manually"""
-        default_config = """
-[session]
-[session.downloads]
-folder = "/usr/src/app/downloads/"
-concurrency = 4
-
-[session.qobuz]
-quality = 3
-email_or_userid = ""
-password_or_token = ""
-use_auth_token = false
-
-[session.tidal]
-quality = 3
-username = ""
-password = ""
-user_id = ""
-country_code = ""
-access_token = ""
-refresh_token = ""
-token_expiry = ""
-
-[session.deezer]
-quality = 2
-arl = ""
-
-[session.soundcloud]
-quality = 1
-
-[session.youtube]
-quality = 0
-
-[session.conversion]
-enabled = false
-codec = "flac"
-
-[session.database]
-downloads_enabled = true
-failed_downloads_enabled = true
-downloads_path = "~/.config/streamrip/streamrip_downloads.db"
-failed_downloads_path = "~/.config/streamrip/streamrip_failed.db"
-
-[session.filepaths]
-track_format = "{artist} - {title}"
-folder_format = "{artist} - {album}"
-
-[session.artwork]
-embed = true
-save_artwork = false
-embed_size = 1200
-saved_max_width = 1200
-
-[session.metadata]
-exclude = []
-set_playlist_to_album = true
-renumber_playlist_tracks = true
-
-[session.misc]
-max_search_results = 20
-"""
+        # A file left by a previous run parses the same as a fresh one,
+        # so reuse it and skip the write on this cold-start fallback
+        if self.config_path.exists():
+            LOGGER.info(f"Reusing existing config file at {self.config_path}")
+            return
 
         try:
-            import aiofiles
-
-            async with aiofiles.open(self.config_path, "w") as f:
-                await f.write(default_config.strip())
+            # One small write at startup; a plain write_text on a worker
+            # thread beats aiofiles' per-operation async plumbing here
+            await asyncio.to_thread(
+                self.config_path.write_text, _DEFAULT_CONFIG_TOML, encoding="utf-8"
+            )
             LOGGER.info(f"Created default config file at {self.config_path}")
         except Exception as e:
             LOGGER.error(f"Failed to create default config file: {e}")
@@ -173,93 +210,69 @@ max_search_results = 20
             return
 
         try:
-            from config_manager import Config
+            # One probe for the session object replaces the repeated
+            # hasattr(self.config, "session") checks; each section below
+            # is fetched once with a getattr default instead of a
+            # hasattr probe followed by a second lookup
+            session = getattr(self.config, "session", None)
+            if session is None:
+                return
 
             # Download settings - use DOWNLOAD_DIR
-            if hasattr(self.config, "session") and hasattr(
-                self.config.session, "downloads"
-            ):
-                self.config.session.downloads.folder = Config.DOWNLOAD_DIR
-                self.config.session.downloads.concurrency = (
-                    Config.STREAMRIP_CONCURRENT_DOWNLOADS
-                )
+            downloads = getattr(session, "downloads", None)
+            if downloads is not None:
+                downloads.folder = Config.DOWNLOAD_DIR
+                downloads.concurrency = Config.STREAMRIP_CONCURRENT_DOWNLOADS
 
             # Quality settings for each platform
-            if hasattr(self.config, "session"):
-                if hasattr(self.config.session, "qobuz"):
-                    self.config.session.qobuz.quality = (
-                        Config.STREAMRIP_QOBUZ_QUALITY
-                    )
-                if hasattr(self.config.session, "tidal"):
-                    self.config.session.tidal.quality = (
-                        Config.STREAMRIP_TIDAL_QUALITY
-                    )
-                if hasattr(self.config.session, "deezer"):
-                    self.config.session.deezer.quality = (
-                        Config.STREAMRIP_DEEZER_QUALITY
-                    )
-                if hasattr(self.config.session, "soundcloud"):
-                    self.config.session.soundcloud.quality = (
-                        Config.STREAMRIP_SOUNDCLOUD_QUALITY
-                    )
+            for platform, cfg_key in _PLATFORM_QUALITY:
+                section = getattr(session, platform, None)
+                if section is not None:
+                    section.quality = getattr(Config, cfg_key)
 
             # Authentication settings
             await self._apply_auth_settings()
 
-            # Metadata settings
-            if hasattr(self.config, "session") and hasattr(
-                self.config.session, "metadata"
-            ):
-                # Set metadata exclusions
-                if Config.STREAMRIP_METADATA_EXCLUDE:
-                    self.config.session.metadata.exclude = (
-                        Config.STREAMRIP_METADATA_EXCLUDE
-                    )
+            # Metadata settings; values that are both tested and
+            # assigned are read into locals once
+            metadata = getattr(session, "metadata", None)
+            exclude = Config.STREAMRIP_METADATA_EXCLUDE
+            if metadata is not None and exclude:
+                metadata.exclude = exclude
 
             # File paths
-            if hasattr(self.config, "session") and hasattr(
-                self.config.session, "filepaths"
-            ):
-                if Config.STREAMRIP_FILEPATHS_TRACK_FORMAT:
-                    self.config.session.filepaths.track_format = (
-                        Config.STREAMRIP_FILEPATHS_TRACK_FORMAT
-                    )
-                if Config.STREAMRIP_FILEPATHS_FOLDER_FORMAT:
-                    self.config.session.filepaths.folder_format = (
-                        Config.STREAMRIP_FILEPATHS_FOLDER_FORMAT
-                    )
+            filepaths = getattr(session, "filepaths", None)
+            if filepaths is not None:
+                track_format = Config.STREAMRIP_FILEPATHS_TRACK_FORMAT
+                if track_format:
+                    filepaths.track_format = track_format
+                folder_format = Config.STREAMRIP_FILEPATHS_FOLDER_FORMAT
+                if folder_format:
+                    filepaths.folder_format = folder_format
 
             # Artwork settings
-            if hasattr(self.config, "session") and hasattr(
-                self.config.session, "artwork"
-            ):
-                self.config.session.artwork.embed = Config.STREAMRIP_EMBED_COVER_ART
-                self.config.session.artwork.save_artwork = (
-                    Config.STREAMRIP_SAVE_COVER_ART
-                )
+            artwork = getattr(session, "artwork", None)
+            if artwork is not None:
+                artwork.embed = Config.STREAMRIP_EMBED_COVER_ART
+                artwork.save_artwork = Config.STREAMRIP_SAVE_COVER_ART
 
             # Database settings
-            if hasattr(self.config, "session") and hasattr(
-                self.config.session, "database"
-            ):
-                self.config.session.database.downloads_enabled = (
+            database = getattr(session, "database", None)
+            if database is not None:
+                database.downloads_enabled = (
                     Config.STREAMRIP_DATABASE_DOWNLOADS_ENABLED
                 )
-                self.config.session.database.failed_downloads_enabled = (
+                database.failed_downloads_enabled = (
                     Config.STREAMRIP_DATABASE_FAILED_DOWNLOADS_ENABLED
                 )
 
             # Conversion settings
-            if hasattr(self.config, "session") and hasattr(
-                self.config.session, "conversion"
-            ):
-                self.config.session.conversion.enabled = (
-                    Config.STREAMRIP_CONVERSION_ENABLED
-                )
-                if Config.STREAMRIP_CONVERSION_CODEC:
-                    self.config.session.conversion.codec = (
-                        Config.STREAMRIP_CONVERSION_CODEC
-                    )
+            conversion = getattr(session, "conversion", None)
+            if conversion is not None:
+                conversion.enabled = Config.STREAMRIP_CONVERSION_ENABLED
+                codec = Config.STREAMRIP_CONVERSION_CODEC
+                if codec:
+                    conversion.codec = codec
 
         except Exception as e:
             LOGGER.error(f"Error applying bot settings to streamrip config: {e}")
@@ -267,58 +280,58 @@ max_search_results = 20
     async def _apply_auth_settings(self):
         """Apply authentication settings"""
         try:
-            from config_manager import Config
-
-            # Qobuz authentication
-            if hasattr(self.config.session, "qobuz"):
-                if Config.STREAMRIP_QOBUZ_EMAIL:
-                    self.config.session.qobuz.email_or_userid = (
-                        Config.STREAMRIP_QOBUZ_EMAIL
-                    )
-                if Config.STREAMRIP_QOBUZ_PASSWORD:
-                    self.config.session.qobuz.password_or_token = (
-                        Config.STREAMRIP_QOBUZ_PASSWORD
-                    )
-
-            # Tidal authentication
-            if hasattr(self.config.session, "tidal"):
-                if Config.STREAMRIP_TIDAL_ACCESS_TOKEN:
-                    self.config.session.tidal.access_token = (
-                        Config.STREAMRIP_TIDAL_ACCESS_TOKEN
-                    )
-                if Config.STREAMRIP_TIDAL_REFRESH_TOKEN:
-                    self.config.session.tidal.refresh_token = (
-                        Config.STREAMRIP_TIDAL_REFRESH_TOKEN
-                    )
-                if Config.STREAMRIP_TIDAL_USER_ID:
-                    self.config.session.tidal.user_id = (
-                        Config.STREAMRIP_TIDAL_USER_ID
-                    )
-                if Config.STREAMRIP_TIDAL_COUNTRY_CODE:
-                    self.config.session.tidal.country_code = (
-                        Config.STREAMRIP_TIDAL_COUNTRY_CODE
-                    )
-
-            # Deezer authentication
-            if hasattr(self.config.session, "deezer"):
-                if Config.STREAMRIP_DEEZER_ARL:
-                    self.config.session.deezer.arl = Config.STREAMRIP_DEEZER_ARL
+            session = self.config.session
+
+            for platform, field, cfg_key in _AUTH_FIELDS:
+                value = getattr(Config, cfg_key)
+                if value:
+                    section = getattr(session, platform, None)
+                    if section is not None:
+                        setattr(section, field, value)
 
         except Exception as e:
             LOGGER.error(f"Error applying auth settings: {e}")
 
+    def _applied_settings_hash(self) -> int:
+        """Hash of every Config field _apply_bot_settings writes into
+        the streamrip config"""
+        values = [Config.DOWNLOAD_DIR, Config.STREAMRIP_CONCURRENT_DOWNLOADS]
+        values.extend(getattr(Config, key) for _, key in _PLATFORM_QUALITY)
+        values.extend(getattr(Config, key) for _, _, key in _AUTH_FIELDS)
+        values.append(tuple(Config.STREAMRIP_METADATA_EXCLUDE or ()))
+        values.extend(
+            (
+                Config.STREAMRIP_FILEPATHS_TRACK_FORMAT,
+                Config.STREAMRIP_FILEPATHS_FOLDER_FORMAT,
+                Config.STREAMRIP_EMBED_COVER_ART,
+                Config.STREAMRIP_SAVE_COVER_ART,
+                Config.STREAMRIP_DATABASE_DOWNLOADS_ENABLED,
+                Config.STREAMRIP_DATABASE_FAILED_DOWNLOADS_ENABLED,
+                Config.STREAMRIP_CONVERSION_ENABLED,
+                Config.STREAMRIP_CONVERSION_CODEC,
+            )
+        )
+        return hash(tuple(values))
+
     async def save_config(self):
-        """Save configuration to file"""
+        """Save configuration to file, skipping the write when the
+        applied settings match the last save"""
         if not self.config or not self.config_path:
             return
 
+        settings_hash = self._applied_settings_hash()
+        if settings_hash == self._last_settings_hash:
+            LOGGER.debug("Streamrip config unchanged; skipping save")
+            return
+
         try:
             self.config.save(str(self.config_path))
+            self._last_settings_hash = settings_hash
             LOGGER.debug(f"Saved streamrip config to {self.config_path}")
         except Exception as e:
             LOGGER.error(f"Failed to save streamrip config: {e}")
 
-    def get_config(self) -> StreamripConfig | None:
+    def get_config(self) -> "StreamripConfig | None":
         """Get the streamrip configuration"""
         return self.config
 
@@ -328,15 +341,25 @@ max_search_results = 20
 
     def is_database_enabled(self) -> bool:
         """Check if streamrip database is enabled in bot settings"""
-        from config_manager import Config
-
         return Config.STREAMRIP_ENABLE_DATABASE
 
-    def get_platform_status(self) -> dict[str, bool]:
-        """Get simplified platform status"""
-        from config_manager import Config
+    def invalidate_platform_status(self):
+        """Drop the cached platform status after credentials or platform
+        toggles change"""
+        self._platform_status = None
 
-        return {
+    def get_platform_status(self) -> dict[str, bool]:
+        """Get simplified platform status, cached against the Config
+        version counter so any setting write invalidates it exactly"""
+        version = Config._version
+        if (
+            self._platform_status is not None
+            and self._platform_status_version == version
+        ):
+            return self._platform_status
+
+        self._platform_status_version = version
+        self._platform_status = {
             "qobuz": bool(
                 Config.STREAMRIP_QOBUZ_ENABLED and Config.STREAMRIP_QOBUZ_EMAIL
             ),
@@ -350,6 +373,7 @@ max_search_results = 20
             "soundcloud": Config.STREAMRIP_SOUNDCLOUD_ENABLED,
             "lastfm": Config.STREAMRIP_LASTFM_ENABLED,
         }
+        return self._platform_status
 
 
 # Global instance
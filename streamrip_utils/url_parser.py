@@ -320,14 +320,28 @@ class StreamripURLParser:
         return platform_info.get(platform, {})
 
 
+# Memoized parse results: the same URL is typically parsed several times
+# per request (validation, download, metadata), so one regex pass suffices
+_parse_cache: dict[str, tuple[str, str, str] | None] = {}
+_PARSE_CACHE_MAX = 1024
+
+
 async def is_streamrip_url(url: str) -> bool:
     """Check if URL is supported by streamrip"""
-    return await StreamripURLParser.is_music_url(url)
+    return await parse_streamrip_url(url) is not None
 
 
 async def parse_streamrip_url(url: str) -> tuple[str, str, str] | None:
     """Parse streamrip URL and return platform, media_type, media_id"""
-    return await StreamripURLParser.parse_url(url)
+    if url in _parse_cache:
+        return _parse_cache[url]
+
+    result = await StreamripURLParser.parse_url(url)
+
+    if len(_parse_cache) >= _PARSE_CACHE_MAX:
+        _parse_cache.clear()
+    _parse_cache[url] = result
+    return result
 
 
 def is_file_input(input_str: str) -> bool:
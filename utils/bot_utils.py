@@ -1,17 +1,67 @@
 import asyncio
+import re
+import sys
 import time
-from functools import wraps
+from functools import lru_cache, wraps
+from itertools import count
 from logging import getLogger
 
+from config_manager import Config
+
 LOGGER = getLogger(__name__)
 
+# Matches a flag token and its optional value in one C-level scan; the
+# lookbehind keeps dashes inside words from starting a flag
+_ARG_RE = re.compile(r"(?<!\S)(-\S+)(?:\s+(?!-)(\S+))?")
+
+
+# Strong references to fire-and-forget tasks: the event loop only keeps
+# weak ones, so an untracked task can be garbage-collected mid-flight
+# and silently drop its exception. Shutdown code can also cancel these.
+_background_tasks: set = set()
+
 
 def new_task(func):
     """Decorator to run function as a new task"""
 
     @wraps(func)
     def wrapper(*args, **kwargs):
-        return asyncio.create_task(func(*args, **kwargs))
+        task = asyncio.create_task(func(*args, **kwargs))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+        return task
+
+    return wrapper
+
+
+def telegram_handler(func):
+    """Decorator for command handlers: logs failures, replies with the
+    error, and warns when a handler runs long enough to suggest it is
+    blocking the event loop"""
+
+    @wraps(func)
+    async def wrapper(client, message, *args, **kwargs):
+        from utils.message_utils import send_message
+
+        start = time.monotonic()
+        try:
+            return await func(client, message, *args, **kwargs)
+        except Exception as e:
+            LOGGER.exception("Handler %s failed: %s", func.__name__, e)
+            try:
+                await send_message(message, f"❌ Error: {e}")
+            except Exception:
+                pass
+        finally:
+            # Wall time, not loop-blocking time: every await (Telegram
+            # round trips, whole downloads) counts toward it, so this is
+            # a debug-level hint with a generous threshold rather than a
+            # warning that fires on normal traffic
+            elapsed = time.monotonic() - start
+            if elapsed > 1.0:
+                LOGGER.debug(
+                    "Handler %s took %.1fms", func.__name__, elapsed * 1000
+                )
 
     return wrapper
 
@@ -21,64 +71,82 @@ def arg_parser(text, separator=" "):
     if not text:
         return {}
 
-    args = {}
-    parts = text.split(separator)
+    if separator != " ":
+        text = text.replace(separator, " ")
 
-    for i, part in enumerate(parts):
-        if part.startswith("-"):
-            # Flag with value
-            if i + 1 < len(parts) and not parts[i + 1].startswith("-"):
-                args[part] = parts[i + 1]
-            else:
-                # Boolean flag
-                args[part] = True
+    return {
+        m.group(1): m.group(2) if m.group(2) is not None else True
+        for m in _ARG_RE.finditer(text)
+    }
 
-    return args
 
+_PERIODS = (("d", 86400), ("h", 3600), ("m", 60), ("s", 1))
 
-def get_readable_time(seconds):
-    """Convert seconds to readable time format"""
-    if seconds <= 0:
-        return "0s"
-
-    periods = [("d", 86400), ("h", 3600), ("m", 60), ("s", 1)]
 
+@lru_cache(maxsize=4096)
+def _fmt_time(seconds):
+    """Format a positive whole number of seconds; cached because status
+    renders keep asking for the same values"""
     result = []
-    for period_name, period_seconds in periods:
+    for period_name, period_seconds in _PERIODS:
         if seconds >= period_seconds:
             period_value, seconds = divmod(seconds, period_seconds)
-            result.append(f"{int(period_value)}{period_name}")
+            result.append(str(period_value))
+            result.append(period_name)
+            result.append(" ")
 
-    return " ".join(result)
+    return "".join(result[:-1])
 
 
-class MirrorStatus:
-    """Status constants for downloads"""
+def get_readable_time(seconds):
+    """Convert seconds to readable time format"""
+    seconds = int(seconds)
+    if seconds <= 0:
+        return "0s"
+    return _fmt_time(seconds)
 
-    STATUS_DOWNLOAD = "Downloading"
-    STATUS_UPLOAD = "Uploading"
-    STATUS_QUEUEDL = "Queued Download"
-    STATUS_QUEUEUP = "Queued Upload"
-    STATUS_PAUSED = "Paused"
-    STATUS_ARCHIVING = "Archiving"
-    STATUS_EXTRACTING = "Extracting"
-    STATUS_CLONING = "Cloning"
-    STATUS_SEEDING = "Seeding"
+
+class MirrorStatus:
+    """Status constants for downloads; interned so equality checks
+    against them short-circuit on identity"""
+
+    STATUS_DOWNLOAD = sys.intern("Downloading")
+    STATUS_UPLOAD = sys.intern("Uploading")
+    STATUS_QUEUEDL = sys.intern("Queued Download")
+    STATUS_QUEUEUP = sys.intern("Queued Upload")
+    STATUS_PAUSED = sys.intern("Paused")
+    STATUS_ARCHIVING = sys.intern("Archiving")
+    STATUS_EXTRACTING = sys.intern("Extracting")
+    STATUS_CLONING = sys.intern("Cloning")
+    STATUS_SEEDING = sys.intern("Seeding")
+
+
+# States in which a task is actively moving data; membership test is a
+# single hash lookup
+_ACTIVE_STATES = frozenset(
+    {
+        MirrorStatus.STATUS_DOWNLOAD,
+        MirrorStatus.STATUS_UPLOAD,
+        MirrorStatus.STATUS_ARCHIVING,
+        MirrorStatus.STATUS_EXTRACTING,
+        MirrorStatus.STATUS_CLONING,
+        MirrorStatus.STATUS_SEEDING,
+    }
+)
 
 
 def is_authorized(user_id, authorized_chats=None, sudo_users=None):
     """Check if user is authorized"""
-    from config_manager import Config
-
     # Owner is always authorized
     if user_id == Config.OWNER_ID:
         return True
 
-    # Check sudo users
-    if sudo_users or Config.SUDO_USERS:
-        sudo_list = sudo_users or Config.SUDO_USERS.split()
-        if str(user_id) in sudo_list:
+    # Check sudo users (pre-parsed into an int set at config load)
+    if sudo_users is not None:
+        if str(user_id) in sudo_users:
             return True
+    elif user_id in Config.SUDO_USER_IDS:
+        return True
 
     return True  # For standalone bot, allow all users by default
 
@@ -112,6 +180,11 @@ class TaskConfig:
         self.is_cancelled = False
 
 
+# Sequence appended to task IDs so two tasks created in the same clock
+# tick can never collide
+_tid_seq = count()
+
+
 def generate_task_id():
     """Generate a unique task ID"""
-    return str(int(time.time() * 1000))
\ No newline at end of file
+    return f"{time.monotonic_ns()}{next(_tid_seq)}"
\ No newline at end of file
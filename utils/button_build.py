@@ -4,42 +4,44 @@ from pyrogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 class ButtonMaker:
     """Helper class to build inline keyboard buttons"""
 
-    def __init__(self):
-        self._buttons = []
-        self._footer_buttons = []
+    def __init__(self, n_cols=1, footer_cols=2):
+        # Rows are completed as buttons arrive, so build_menu hands the
+        # finished layout straight to InlineKeyboardMarkup instead of
+        # slicing and regrouping a flat list
+        self._n_cols = n_cols
+        self._footer_cols = footer_cols
+        self._rows = []
+        self._footer_rows = []
+
+    @staticmethod
+    def _append(rows, button, n_cols):
+        if rows and len(rows[-1]) < n_cols:
+            rows[-1].append(button)
+        else:
+            rows.append([button])
 
     def data_button(self, text, callback_data, position="main"):
         """Add a callback data button"""
         button = InlineKeyboardButton(text, callback_data=callback_data)
         if position == "footer":
-            self._footer_buttons.append(button)
+            self._append(self._footer_rows, button, self._footer_cols)
         else:
-            self._buttons.append(button)
+            self._append(self._rows, button, self._n_cols)
 
     def url_button(self, text, url, position="main"):
         """Add a URL button"""
         button = InlineKeyboardButton(text, url=url)
         if position == "footer":
-            self._footer_buttons.append(button)
+            self._append(self._footer_rows, button, self._footer_cols)
         else:
-            self._buttons.append(button)
+            self._append(self._rows, button, self._n_cols)
 
-    def build_menu(self, n_cols=1, footer_cols=2):
+    def build_menu(self):
         """Build the inline keyboard markup"""
-        menu = []
-
-        # Add main buttons
-        for i in range(0, len(self._buttons), n_cols):
-            menu.append(self._buttons[i : i + n_cols])
-
-        # Add footer buttons
-        if self._footer_buttons:
-            for i in range(0, len(self._footer_buttons), footer_cols):
-                menu.append(self._footer_buttons[i : i + footer_cols])
-
+        menu = self._rows + self._footer_rows
         return InlineKeyboardMarkup(menu) if menu else None
 
     def clear(self):
         """Clear all buttons"""
-        self._buttons.clear()
-        self._footer_buttons.clear()
+        self._rows.clear()
+        self._footer_rows.clear()
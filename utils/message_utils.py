@@ -1,18 +1,34 @@
 import asyncio
+import heapq
+from itertools import count
 from logging import getLogger
 
 LOGGER = getLogger(__name__)
 
+# Pending auto-deletes as (deadline, seq, message) on a min-heap; one
+# reaper task services all of them instead of a sleeping task (holding
+# the Message alive) per scheduled delete
+_scheduled = []
+_sched_seq = count()
+_sched_wakeup = asyncio.Event()
+_reaper_task = None
+
+
+async def _send_raw(message, text, buttons=None, photo=None, **kwargs):
+    """Send without the log-and-swallow wrapper; callers that handle
+    errors themselves (status loops, gather batches) use this directly
+    and skip the extra exception frame"""
+    if photo:
+        return await message.reply_photo(
+            photo, caption=text, reply_markup=buttons, **kwargs
+        )
+    return await message.reply_text(text, reply_markup=buttons, **kwargs)
+
 
 async def send_message(message, text, buttons=None, photo=None, **kwargs):
     """Send a message to Telegram"""
     try:
-        if photo:
-            return await message.reply_photo(
-                photo, caption=text, reply_markup=buttons, **kwargs
-            )
-        else:
-            return await message.reply_text(text, reply_markup=buttons, **kwargs)
+        return await _send_raw(message, text, buttons, photo, **kwargs)
     except Exception as e:
         LOGGER.error(f"Error sending message: {e}")
         return None
@@ -21,10 +37,9 @@ async def send_message(message, text, buttons=None, photo=None, **kwargs):
 async def edit_message(message, text, buttons=None, **kwargs):
     """Edit a message"""
     try:
-        if buttons:
-            return await message.edit_text(text, reply_markup=buttons, **kwargs)
-        else:
-            return await message.edit_text(text, **kwargs)
+        # reply_markup=None is a no-op for pyrogram, so one unconditional
+        # call covers both the with- and without-buttons cases
+        return await message.edit_text(text, reply_markup=buttons, **kwargs)
     except Exception as e:
         LOGGER.error(f"Error editing message: {e}")
         return None
@@ -41,17 +56,38 @@ async def delete_message(message):
 
 
 async def auto_delete_message(message, time=300):
-    """Auto delete a message after specified time"""
-    try:
-        await asyncio.sleep(time)
+    """Schedule a message for deletion after the specified time;
+    returns immediately"""
+    global _reaper_task
+
+    loop = asyncio.get_running_loop()
+    heapq.heappush(_scheduled, (loop.time() + time, next(_sched_seq), message))
+    _sched_wakeup.set()
+    if _reaper_task is None or _reaper_task.done():
+        _reaper_task = asyncio.create_task(_delete_reaper())
+
+
+async def _delete_reaper():
+    """Sleep until the earliest deadline, delete, repeat; exits when the
+    heap drains and is restarted by the next schedule"""
+    loop = asyncio.get_running_loop()
+    while _scheduled:
+        delay = _scheduled[0][0] - loop.time()
+        if delay > 0:
+            # Wake early if something with a nearer deadline arrives
+            _sched_wakeup.clear()
+            try:
+                await asyncio.wait_for(_sched_wakeup.wait(), timeout=delay)
+            except TimeoutError:
+                pass
+            continue
+        _, _, message = heapq.heappop(_scheduled)
         await delete_message(message)
-    except Exception as e:
-        LOGGER.error(f"Error auto-deleting message: {e}")
 
 
-async def send_status_message(message, text, **kwargs):
-    """Send a status message"""
-    return await send_message(message, text, **kwargs)
+# Status messages go through the same send path; an alias avoids an
+# extra coroutine frame per call while keeping the import name stable
+send_status_message = send_message
 
 
 async def update_status_message(chat_id):